@@ -0,0 +1 @@
+"""Slide kit builders shared by the PPTX and SVG/HTML writers."""
@@ -0,0 +1,145 @@
+"""Append slides to an existing PPTX in place.
+
+New slide parts are written where the old central directory started, then
+the four package parts that list slides are patched and re-added, and a new
+central directory is written. Every other member keeps its original
+compressed bytes and offset, so appending a turn costs the same on turn 5 as
+on turn 500.
+
+The superseded copies of the patched parts stay in the file as unreferenced
+bytes; ``compact`` drops them by copying members over without recompressing.
+"""
+
+import os
+import re
+import zlib
+
+from .package import PackageWriter, compress_part, inflate, read_entries, read_part, renamed
+from .pptx import TRAILING_PROPERTY, compile_slide, theme_xml
+
+CONTENT_TYPES = "[Content_Types].xml"
+PRESENTATION = "ppt/presentation.xml"
+PRESENTATION_RELS = "ppt/_rels/presentation.xml.rels"
+APP = "docProps/app.xml"
+THEME = "ppt/theme/theme1.xml"
+CUSTOM = "docProps/custom.xml"
+PATCHED = (CONTENT_TYPES, PRESENTATION, PRESENTATION_RELS, APP)
+
+SLIDE_NAME = re.compile(r"ppt/slides/slide(\d+)\.xml$")
+SLIDE_CT = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+SLIDE_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+
+
+def insert_before(xml, closing_tag, fragment):
+    pos = xml.rindex(closing_tag)
+    return xml[:pos] + fragment + xml[pos:]
+
+
+def max_int(pattern, xml):
+    return max((int(m) for m in re.findall(pattern, xml)), default=0)
+
+
+def patch_parts(parts, first, count):
+    """Register slides ``first`` .. ``first + count - 1`` in the listing parts."""
+    content_types = parts[CONTENT_TYPES]
+    presentation = parts[PRESENTATION]
+    rels = parts[PRESENTATION_RELS]
+    next_rid = max_int(r'Id="rId(\d+)"', rels) + 1
+    next_sld_id = max(max_int(r'<p:sldId id="(\d+)"', presentation), 256) + 1
+
+    overrides = []
+    sld_ids = []
+    relationships = []
+    for offset in range(count):
+        n = first + offset
+        rid = f"rId{next_rid + offset}"
+        overrides.append(f"<Override PartName=\"/ppt/slides/slide{n}.xml\" ContentType=\"{SLIDE_CT}\"/>")
+        sld_ids.append(f"<p:sldId id=\"{next_sld_id + offset}\" r:id=\"{rid}\"/>")
+        relationships.append(f"<Relationship Id=\"{rid}\" Type=\"{SLIDE_REL}\" Target=\"slides/slide{n}.xml\"/>")
+
+    if "<p:sldIdLst>" not in presentation:
+        presentation = presentation.replace("</p:sldMasterIdLst>", "</p:sldMasterIdLst><p:sldIdLst></p:sldIdLst>", 1)
+    total = first + count - 1
+    return {
+        CONTENT_TYPES: insert_before(content_types, "</Types>", "".join(overrides)),
+        PRESENTATION: insert_before(presentation, "</p:sldIdLst>", "".join(sld_ids)),
+        PRESENTATION_RELS: insert_before(rels, "</Relationships>", "".join(relationships)),
+        APP: re.sub(r"<Slides>\d+</Slides>", f"<Slides>{total}</Slides>", parts[APP], count=1),
+    }
+
+
+def slide_count(entries):
+    return max((int(m.group(1)) for e in entries if (m := SLIDE_NAME.match(e.name.decode("utf-8")))), default=0)
+
+
+def trailing_slides(f, by_name):
+    """Slides after the turns, as recorded by ``write_pptx(..., trailing=n)``."""
+    if CUSTOM not in by_name:
+        return 0
+    custom = inflate(read_part(f, by_name[CUSTOM])).decode("utf-8")
+    m = re.search(rf'name="{TRAILING_PROPERTY}"><vt:i4>(\d+)</vt:i4>', custom)
+    return int(m.group(1)) if m else 0
+
+
+def deck_slide_count(path):
+    with open(path, "rb") as f:
+        return slide_count(read_entries(f)[0])
+
+
+def append_slides(path, slides, cache=None, minimize=False):
+    """Append ``slides`` to the deck at ``path``; returns the new slide count.
+
+    Minimized slides point at the theme's line styles by index, so
+    ``minimize`` is ignored unless the deck's theme is byte-identical to the
+    one this version writes. Decks with embedded font subsets are refused
+    with ValueError, since the subsets cannot draw glyphs new slides add, and
+    so are decks with sections after their turns, where new turns would land
+    after the section.
+    """
+    with open(path, "r+b") as f:
+        entries, cd_offset = read_entries(f)
+        existing = slide_count(entries)
+        by_name = {e.name.decode("utf-8"): e for e in entries}
+        # Checked even with nothing to add: the caller's turn count is already wrong for such decks.
+        trailing = trailing_slides(f, by_name)
+        if trailing:
+            raise ValueError(f"{path} has {trailing} slides after its turns; rebuild it instead of appending")
+        if not slides:
+            return existing
+
+        theme = by_name.get(THEME)
+        if minimize and (theme is None or theme.crc != zlib.crc32(theme_xml.encode("utf-8"))):
+            minimize = False
+        listing = {name: inflate(read_part(f, by_name[name])).decode("utf-8") for name in PATCHED}
+        if "<p:embeddedFontLst>" in listing[PRESENTATION]:
+            raise ValueError(f"{path} embeds font subsets; rebuild it instead of appending")
+        patched = patch_parts(listing, existing + 1, len(slides))
+
+        # Compile and deflate everything first: once the old central directory
+        # is overwritten, a failure would leave the deck unreadable.
+        new_parts = []
+        for i, shapes in enumerate(slides, existing + 1):
+            xml_part, rels_part = compile_slide(shapes, cache, minimize)
+            new_parts.append(renamed(xml_part, f"ppt/slides/slide{i}.xml"))
+            new_parts.append(renamed(rels_part, f"ppt/slides/_rels/slide{i}.xml.rels"))
+        new_parts.extend(compress_part(name, patched[name]) for name in PATCHED)
+
+        kept = [e for e in entries if e.name.decode("utf-8") not in PATCHED]
+        f.seek(cd_offset)
+        with PackageWriter(f, offset=cd_offset, entries=kept) as z:
+            for part in new_parts:
+                z.add_part(part)
+        f.truncate()
+    return existing + len(slides)
+
+
+def compact(path):
+    """Rewrite ``path`` without unreferenced bytes; members are not recompressed."""
+    tmp = path + ".tmp"
+    with open(path, "rb") as src, open(tmp, "wb") as dst:
+        entries, _ = read_entries(src)
+        with PackageWriter(dst) as z:
+            # Appends leave [Content_Types].xml at the end; put it back first.
+            for e in sorted(entries, key=lambda e: (e.name != CONTENT_TYPES.encode(), e.offset)):
+                z.add_part(read_part(src, e))
+    os.replace(tmp, path)
@@ -0,0 +1,145 @@
+"""Persistent content-addressed cache of compressed slide parts.
+
+Entries are keyed by a hash of a slide's shape descriptions (plus whatever
+serializer settings the caller salts in) and hold the slide's parts already
+deflated, ready for ``PackageWriter.add_part``. The cache is bounded in
+bytes and evicts least recently used entries first; recency is the entry
+file's mtime, so it carries over between runs and processes.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from collections import OrderedDict
+
+from .package import Part
+
+ENTRY_SUFFIX = ".parts"
+COUNT = struct.Struct("<H")
+PART_HEADER = struct.Struct("<HLQL")
+
+
+def slide_key(shapes, *salt):
+    payload = json.dumps([shapes, salt], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def encode_entry(parts):
+    out = [COUNT.pack(len(parts))]
+    for part in parts:
+        name = part.name.encode("utf-8")
+        out.append(PART_HEADER.pack(len(name), part.crc, part.size, len(part.data)))
+        out.append(name)
+        out.append(part.data)
+    return b"".join(out)
+
+
+def decode_entry(blob):
+    (count,) = COUNT.unpack_from(blob, 0)
+    pos = COUNT.size
+    parts = []
+    for _ in range(count):
+        name_len, crc, size, data_len = PART_HEADER.unpack_from(blob, pos)
+        pos += PART_HEADER.size
+        name = blob[pos:pos + name_len].decode("utf-8")
+        pos += name_len
+        parts.append(Part(name, crc, size, blob[pos:pos + data_len]))
+        pos += data_len
+    return parts
+
+
+class SlideCache:
+    def __init__(self, root, max_bytes=512 * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> entry size, least recently used first
+        self._entries = OrderedDict()
+        self._total = 0
+        os.makedirs(root, exist_ok=True)
+        self._load()
+        self._evict()
+
+    def _load(self):
+        found = []
+        for shard in os.listdir(self.root):
+            shard_dir = os.path.join(self.root, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for filename in os.listdir(shard_dir):
+                if not filename.endswith(ENTRY_SUFFIX):
+                    continue
+                st = os.stat(os.path.join(shard_dir, filename))
+                found.append((st.st_mtime, filename[:-len(ENTRY_SUFFIX)], st.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total += size
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key + ENTRY_SUFFIX)
+
+    def _forget(self, key):
+        self._total -= self._entries.pop(key, 0)
+
+    def get(self, key):
+        """Return the cached parts for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            # Evicted, possibly by another process sharing the directory.
+            self._forget(key)
+            self.misses += 1
+            return None
+        if key not in self._entries:
+            self._total += len(blob)
+        self._entries[key] = len(blob)
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return decode_entry(blob)
+
+    def put(self, key, parts):
+        blob = encode_entry(parts)
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        self._forget(key)
+        self._entries[key] = len(blob)
+        self._total += len(blob)
+        self._evict(keep=key)
+
+    def _evict(self, keep=None):
+        while self._total > self.max_bytes and self._entries:
+            if keep is not None and len(self._entries) == 1:
+                break
+            key = next(iter(self._entries))
+            if key == keep:
+                self._entries.move_to_end(key)
+                continue
+            self._forget(key)
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                # Another process sharing the directory evicted it first.
+                continue
+            self.evictions += 1
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._total,
+        }
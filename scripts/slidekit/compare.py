@@ -0,0 +1,182 @@
+"""Comparison decks for forked games.
+
+Forks of a game share their first turns and then diverge. Each turn is
+reduced to a content hash; the shared prefix is the leading run of hashes
+every branch agrees on, found in one linear scan. Diverged turns that later
+match another branch again are marked on the side-by-side slides.
+
+The comparison deck holds a cover, the shared turns once, then one
+side-by-side slide per diverged turn. Every branch also gets its own report
+deck (cover plus turns, so it stays appendable). The shared turn slides are
+compiled once and the same deflated parts are written into every deck.
+"""
+
+import hashlib
+import json
+
+from .layout import COLORS, FONTS, SLIDE_H, SLIDE_W, emu, paragraph, shape_rect, shape_textbox, text_run
+from .pptx import compile_slide, write_package
+from .report import agent_names, clip, cover_slide, eyebrow, game_title, game_turns, turn_slide
+
+MAX_COLUMNS = 3
+MAX_COMPARE_NARRATION_CHARS = 520
+MAX_COMPARE_ACTIONS = 4
+
+
+def turn_signature(snapshot):
+    payload = json.dumps(
+        [snapshot.get("headline"), snapshot.get("narration"), snapshot.get("agents"), snapshot.get("agentActions")],
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def shared_prefix(turn_lists):
+    """Length of the leading run of turns every branch has in common."""
+    prefix = 0
+    for snapshots in zip(*turn_lists):
+        if len({turn_signature(t) for t in snapshots}) != 1:
+            break
+        prefix += 1
+    return prefix
+
+
+def branch_labels(records):
+    titles = [game_title(r) for r in records]
+    if len(set(titles)) == len(titles):
+        return titles
+    return [f"Branch {i} · {r.get('id') or title}" for i, (r, title) in enumerate(zip(records, titles), 1)]
+
+
+def comparison_cover(records, labels, prefix):
+    shapes = []
+    sp = 2
+    shapes.append(shape_rect(sp, "Background", 0, 0, SLIDE_W, SLIDE_H, fill=(COLORS["bg"], 1.0)))
+    sp += 1
+    shapes.append(eyebrow(sp, "Eyebrow", "FORK COMPARISON", emu(0.8), emu(0.7), emu(3.0)))
+    sp += 1
+    shapes.append(shape_textbox(
+        sp, "Title", emu(0.8), emu(1.6), emu(11.0), emu(1.4),
+        [paragraph([text_run(game_title(records[0]), FONTS["display"], 4400, COLORS["ink"])])],
+    ))
+    sp += 1
+    shared = f"{prefix} shared turns" if prefix else "No shared turns"
+    paras = [paragraph([text_run(shared.upper(), FONTS["body"], 900, COLORS["stone500"], bold=True)])]
+    for label, record in zip(labels, records):
+        turns = game_turns(record)
+        paras.append(paragraph([
+            text_run(f"{label}: ", FONTS["body"], 1400, COLORS["ink"], bold=True),
+            text_run(f"{len(turns)} turns", FONTS["body"], 1400, COLORS["muted"]),
+        ], bullet=True))
+    shapes.append(shape_textbox(sp, "Branches", emu(0.8), emu(3.2), emu(11.0), emu(3.6), paras))
+    sp += 1
+    return shapes
+
+
+def branch_column(sp, x, w, label, record, snapshot, same_as):
+    paras = [paragraph([text_run(label.upper(), FONTS["body"], 900, COLORS["stone500"], bold=True)])]
+    if snapshot is None:
+        paras.append(paragraph([text_run("Branch ended before this turn.", FONTS["body"], 1200, COLORS["muted2"])]))
+    elif same_as:
+        paras.append(paragraph([text_run(f"Same as {same_as}.", FONTS["body"], 1200, COLORS["muted2"])]))
+    else:
+        paras.append(paragraph([text_run(clip(snapshot.get("headline", ""), 120), FONTS["display"], 1800, COLORS["ink"])]))
+        paras.append(paragraph([
+            text_run(clip(snapshot.get("narration", ""), MAX_COMPARE_NARRATION_CHARS), FONTS["body"], 1050, COLORS["muted"])
+        ]))
+        names = agent_names(record, snapshot)
+        for act in snapshot.get("agentActions", [])[:MAX_COMPARE_ACTIONS]:
+            name = names.get(act["agentId"], act["agentId"])
+            paras.append(paragraph([
+                text_run(f"{name}: ", FONTS["body"], 1000, COLORS["ink"], bold=True),
+                text_run(clip(act["action"], 90), FONTS["body"], 1000, COLORS["muted"]),
+            ], bullet=True))
+    return shape_textbox(
+        sp, label, x, emu(1.3), w, emu(5.8), paras,
+        align="l", valign="t",
+        fill=(COLORS["surface"], 1.0),
+        line=(COLORS["ink"], 12700, 0.08),
+        round_rect=True,
+        margin=0.16,
+    )
+
+
+def divergence_slides(records, labels, by_turn, turn):
+    """Side-by-side slides for one diverged turn, MAX_COLUMNS branches per slide."""
+    snapshots = [by_turn[i].get(turn) for i in range(len(records))]
+    signatures = [turn_signature(s) if s else None for s in snapshots]
+    slides = []
+    pages = range(0, len(records), MAX_COLUMNS)
+    for page, start in enumerate(pages, 1):
+        shapes = []
+        sp = 2
+        shapes.append(shape_rect(sp, "Background", 0, 0, SLIDE_W, SLIDE_H, fill=(COLORS["bg"], 1.0)))
+        sp += 1
+        label = f"TURN {turn} · DIVERGED" + (f" ({page}/{len(pages)})" if len(pages) > 1 else "")
+        shapes.append(eyebrow(sp, f"Turn {turn}", label, emu(0.8), emu(0.6), emu(3.4)))
+        sp += 1
+        columns = range(start, min(start + MAX_COLUMNS, len(records)))
+        gap = emu(0.25)
+        w = (SLIDE_W - 2 * emu(0.8) - gap * (len(columns) - 1)) // len(columns)
+        for col, i in enumerate(columns):
+            # Forks can rejoin; point at the first earlier branch with the same turn instead of repeating it.
+            same_as = next((labels[j] for j in range(i) if signatures[i] and signatures[j] == signatures[i]), None)
+            x = emu(0.8) + col * (w + gap)
+            shapes.append(branch_column(sp, x, w, labels[i], records[i], snapshots[i], same_as))
+            sp += 1
+        slides.append(shapes)
+    return slides
+
+
+def comparison_plan(records):
+    """Shapes for the comparison deck and each branch deck, plus the shared prefix length."""
+    turn_lists = [game_turns(r) for r in records]
+    prefix = shared_prefix(turn_lists)
+    labels = branch_labels(records)
+    shared = [turn_slide(records[0], t) for t in turn_lists[0][:prefix]]
+
+    by_turn = [{t["turn"]: t for t in turns[prefix:]} for turns in turn_lists]
+    diverged = sorted(set().union(*by_turn))
+    tail = []
+    for turn in diverged:
+        tail.extend(divergence_slides(records, labels, by_turn, turn))
+
+    branches = [([cover_slide(r)], [turn_slide(r, t) for t in turns[prefix:]]) for r, turns in zip(records, turn_lists)]
+    return {
+        "prefix": prefix,
+        "labels": labels,
+        "shared": shared,
+        "comparison": ([comparison_cover(records, labels, prefix)], tail),
+        "branches": branches,
+    }
+
+
+def write_comparison(records, out_path, cache=None, minimize=False, fonts_for=None):
+    """Write the comparison deck to ``out_path`` and ``<base>.branchN.pptx`` per record.
+
+    fonts_for, if given, maps a deck's slide list to its embedded fonts.
+    Returns (comparison slides, branch deck paths, shared prefix length).
+    """
+    plan = comparison_plan(records)
+    # Compiled once, written into the comparison deck and every branch deck.
+    prefix_parts = [compile_slide(shapes, cache, minimize) for shapes in plan["shared"]]
+
+    def write(path, head, tail, title):
+        slides = head + plan["shared"] + tail
+        parts = (
+            [compile_slide(shapes, cache, minimize) for shapes in head]
+            + prefix_parts
+            + [compile_slide(shapes, cache, minimize) for shapes in tail]
+        )
+        write_package(path, len(slides), parts, title, fonts_for(slides) if fonts_for else ())
+        return slides
+
+    base = out_path[:-5] if out_path.endswith(".pptx") else out_path
+    head, tail = plan["comparison"]
+    slides = write(out_path, head, tail, f"{game_title(records[0])} · Fork Comparison")
+    paths = []
+    for n, (record, (branch_head, branch_tail)) in enumerate(zip(records, plan["branches"]), 1):
+        path = f"{base}.branch{n}.pptx"
+        write(path, branch_head, branch_tail, game_title(record))
+        paths.append(path)
+    return slides, paths, plan["prefix"]
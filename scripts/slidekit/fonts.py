@@ -0,0 +1,188 @@
+"""Embed the deck's fonts, subset to the glyphs its slides actually use.
+
+Needs fontTools (``pip install fonttools``); without it ``available()`` is
+False and decks are written without embedded fonts, as before. Only
+TrueType-outline fonts whose license allows embedding are used, since
+PowerPoint cannot embed CFF outlines.
+
+Subsets are keyed by a hash of the font file's bytes and the glyph set, and
+stored in the slide cache when one is given, so a batch of decks that use
+the same text mostly reuses subsets instead of re-subsetting every font.
+"""
+
+import functools
+import hashlib
+import io
+import logging
+import os
+
+from .package import compress_part
+
+try:
+    from fontTools import subset as ft_subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    ft_subset = None
+else:
+    # Tables the subsetter doesn't know (e.g. FFTM) are dropped, which is fine for embedding.
+    logging.getLogger("fontTools.subset").setLevel(logging.ERROR)
+
+# Bump when subsetting options change so cached subsets are not reused.
+SUBSET_VERSION = 1
+
+STYLES = ("regular", "bold", "italic", "boldItalic")
+BULLET = "•"
+
+
+def available():
+    return ft_subset is not None
+
+
+def style_name(bold, italic):
+    return STYLES[bool(bold) + 2 * bool(italic)]
+
+
+def add_text(glyphs, font, bold, italic, text):
+    glyphs.setdefault((font, style_name(bold, italic)), set()).update(text)
+
+
+def deck_glyphs(slides):
+    """Characters used per (typeface, style) across every slide."""
+    glyphs = {}
+    for shapes in slides:
+        for shape in shapes:
+            if shape["kind"] == "textbox":
+                for para in shape["paragraphs"]:
+                    for i, run in enumerate(para["runs"]):
+                        # The bullet glyph is drawn in the first run's font.
+                        text = BULLET + run["text"] if para["bullet"] and i == 0 else run["text"]
+                        add_text(glyphs, run["font"], run["bold"], run["italic"], text)
+            elif shape["kind"] == "table":
+                styles = shape["styles"]
+                header = styles["header"]
+                add_text(glyphs, header["font"], header["bold"], False, "".join(shape["header"]))
+                for r, row in enumerate(shape["rows"]):
+                    style = styles["band"] if r % 2 else styles["body"]
+                    add_text(glyphs, style["font"], style["bold"], False, "".join(row))
+    return glyphs
+
+
+@functools.lru_cache(maxsize=None)
+def file_digest(path, mtime, size):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def embeddable(font):
+    # fsType bit 1 is "restricted license": the font must not be embedded at all.
+    return "glyf" in font and not ("OS/2" in font and font["OS/2"].fsType & 0x2)
+
+
+# usWeightClass each style is matched against, and the weight that splits regular from bold faces.
+STYLE_WEIGHTS = {"regular": 400, "bold": 700, "italic": 400, "boldItalic": 700}
+BOLD_MIN_WEIGHT = 600
+
+
+def face_info(font):
+    """(weight, italic) from the OS/2 table, falling back to head.macStyle."""
+    mac_style = font["head"].macStyle
+    if "OS/2" not in font:
+        return (700 if mac_style & 1 else 400), bool(mac_style & 2)
+    os2 = font["OS/2"]
+    # fsSelection bit 0 is ITALIC, bit 9 OBLIQUE.
+    return os2.usWeightClass, bool(os2.fsSelection & 0x201 or mac_style & 2)
+
+
+@functools.lru_cache(maxsize=None)
+def font_index(font_dir):
+    """Map (typeface, style) to a font file for every usable font in ``font_dir``.
+
+    Each style takes the face whose weight is closest to its target (400 or
+    700), so a Light or Medium file never stands in for Regular while the
+    Regular file is there. Ties go to the heavier face.
+    """
+    candidates = {}
+    for root, _, files in os.walk(font_dir):
+        for filename in sorted(files):
+            if not filename.lower().endswith((".ttf", ".otf")):
+                continue
+            path = os.path.join(root, filename)
+            try:
+                font = TTFont(path, lazy=True)
+            except Exception:
+                continue
+            if not embeddable(font):
+                continue
+            weight, italic = face_info(font)
+            candidates.setdefault((font["name"].getBestFamilyName(), italic), []).append((weight, path))
+
+    index = {}
+    for (family, italic), faces in candidates.items():
+        for style, target in STYLE_WEIGHTS.items():
+            if style.endswith(("italic", "Italic")) != italic:
+                continue
+            bold = target >= BOLD_MIN_WEIGHT
+            # Bold styles only take bold faces and vice versa; a missing style falls back in embed_fonts.
+            usable = [(w, p) for w, p in faces if (w >= BOLD_MIN_WEIGHT) == bold]
+            if usable:
+                index[(family, style)] = min(usable, key=lambda f: (abs(f[0] - target), -f[0], f[1]))[1]
+    return index
+
+
+def subset_font(path, chars):
+    font = TTFont(path)
+    options = ft_subset.Options()
+    options.notdef_outline = True
+    subsetter = ft_subset.Subsetter(options)
+    subsetter.populate(unicodes=sorted(ord(c) for c in chars))
+    subsetter.subset(font)
+    out = io.BytesIO()
+    font.save(out)
+    return out.getvalue()
+
+
+def subset_part(path, chars, cache=None):
+    """The deflated subset of ``path`` covering ``chars``, via the cache if given."""
+    st = os.stat(path)
+    key_src = f"font\0{SUBSET_VERSION}\0{file_digest(path, st.st_mtime, st.st_size)}\0{''.join(sorted(chars))}"
+    key = hashlib.sha256(key_src.encode("utf-8")).hexdigest()
+    if cache is not None:
+        parts = cache.get(key)
+        if parts is not None:
+            return parts[0]
+    part = compress_part("font.fntdata", subset_font(path, chars))
+    if cache is not None:
+        cache.put(key, [part])
+    return part
+
+
+def embed_fonts(slides, font_dir, cache=None):
+    """Subset the deck's fonts found in ``font_dir``.
+
+    Returns (fonts, missing): fonts is a list of (typeface, {style: Part}) in
+    typeface order, missing the sorted typefaces with no usable file. A style
+    with no file of its own falls back to the regular face, which PowerPoint
+    then emboldens or slants itself.
+    """
+    index = font_index(os.path.abspath(font_dir))
+    by_typeface = {}
+    for (typeface, style), chars in deck_glyphs(slides).items():
+        by_typeface.setdefault(typeface, {}).setdefault(style, set()).update(chars)
+
+    fonts, missing = [], []
+    for typeface in sorted(by_typeface):
+        files = {}
+        for style, chars in by_typeface[typeface].items():
+            path = index.get((typeface, style)) or index.get((typeface, "regular"))
+            if path:
+                target = style if (typeface, style) in index else "regular"
+                files.setdefault(target, (path, set()))[1].update(chars)
+        if not files:
+            missing.append(typeface)
+            continue
+        parts = {style: subset_part(path, chars, cache) for style, (path, chars) in files.items()}
+        fonts.append((typeface, {style: parts[style] for style in STYLES if style in parts}))
+    return fonts, missing
@@ -0,0 +1,186 @@
+"""Format-independent slide descriptions.
+
+Slides are plain lists of shape dicts positioned in EMU. The PPTX and SVG
+serializers both consume these, so a deck is laid out once and can then be
+written in either format.
+"""
+
+EMU_PER_INCH = 914400
+EMU_PER_PT = 12700
+
+SLIDE_W_IN = 13.333
+SLIDE_H_IN = 7.5
+SLIDE_W = int(SLIDE_W_IN * EMU_PER_INCH)
+SLIDE_H = int(SLIDE_H_IN * EMU_PER_INCH)
+
+# Brand tokens
+COLORS = {
+    "bg": "F3EFE7",
+    "surface": "FFFFFF",
+    "surface2": "F7F4EE",
+    "surface3": "EFE9E1",
+    "ink": "12151A",
+    "ink2": "222832",
+    "muted": "6D737F",
+    "muted2": "9AA3AD",
+    "accent": "7B1E2B",
+    "accent2": "C2A06A",
+    "accent3": "2A6F66",
+    "stone900": "1C1917",
+    "stone700": "44403C",
+    "stone600": "57534E",
+    "stone500": "78716C",
+    "slate200": "E2E8F0",
+    "rose600": "E11D48",
+    "emerald600": "059669",
+    "amber700": "B45309",
+}
+
+FONTS = {
+    "display": "Fraunces",
+    "body": "Space Grotesk",
+    "mono": "SF Mono",
+}
+
+# Default roundRect corner radius, as a fraction of the shorter side.
+ROUND_RECT_ADJ = 16667
+
+
+def emu(inches):
+    return int(inches * EMU_PER_INCH)
+
+
+def text_run(text, font, size, color, bold=False, italic=False):
+    """size is in hundredths of a point, as in DrawingML."""
+    return {
+        "text": text,
+        "font": font,
+        "size": size,
+        "color": color,
+        "bold": bold,
+        "italic": italic,
+    }
+
+
+def paragraph(runs, align="l", bullet=False):
+    return {"runs": list(runs), "align": align, "bullet": bullet}
+
+
+def merge_runs(runs):
+    """Join adjacent runs that only differ in text."""
+    merged = []
+    for run in runs:
+        if merged and all(merged[-1][k] == run[k] for k in ("font", "size", "color", "bold", "italic")):
+            merged[-1] = dict(merged[-1], text=merged[-1]["text"] + run["text"])
+        else:
+            merged.append(run)
+    return merged
+
+
+def linear_gradient(stops, angle=90):
+    """stops are (position 0..1, color, opacity); angle in degrees, 90 = top to bottom."""
+    return {"gradient": "linear", "angle": angle, "stops": [list(s) for s in stops]}
+
+
+def radial_gradient(stops):
+    """Circular gradient from the shape's center (position 0) to its edge (1)."""
+    return {"gradient": "radial", "stops": [list(s) for s in stops]}
+
+
+def shape_rect(sp_id, name, x, y, w, h, fill=None, line=None, round_rect=False, shadow=False,
+               ellipse=False, glow=None, soft_edge=None):
+    """fill is (color, opacity) or a gradient; line is (color, width_emu, opacity).
+
+    glow is (color, radius_emu, opacity); soft_edge is a radius in EMU.
+    """
+    return {
+        "kind": "rect",
+        "id": sp_id,
+        "name": name,
+        "x": x,
+        "y": y,
+        "w": w,
+        "h": h,
+        "fill": fill,
+        "line": line,
+        "round_rect": round_rect,
+        "ellipse": ellipse,
+        "shadow": shadow,
+        "glow": glow,
+        "soft_edge": soft_edge,
+    }
+
+
+def shape_textbox(sp_id, name, x, y, w, h, paragraphs, align="l", valign="t", fill=None, line=None, round_rect=False, margin=0.08):
+    return {
+        "kind": "textbox",
+        "id": sp_id,
+        "name": name,
+        "x": x,
+        "y": y,
+        "w": w,
+        "h": h,
+        "paragraphs": list(paragraphs),
+        "align": align,
+        "valign": valign,
+        "fill": fill,
+        "line": line,
+        "round_rect": round_rect,
+        "margin": emu(margin),
+    }
+
+
+def cell_style(font, size, color, bold=False, fill=None, margin=0.06):
+    """Shared look for a group of table cells; fill is (color, opacity) or None."""
+    return {"font": font, "size": size, "color": color, "bold": bold, "fill": fill, "margin": emu(margin)}
+
+
+def line_count(text, width, style):
+    """Rough wrapped line count, assuming an average glyph is half an em wide."""
+    glyph_w = style["size"] * EMU_PER_PT // 200
+    per_line = max(1, (width - 2 * style["margin"]) // glyph_w)
+    return max(1, -(-len(text) // per_line))
+
+
+def row_height(cells, col_widths, style, min_h):
+    lines = max(line_count(text, w, style) for text, w in zip(cells, col_widths))
+    return max(min_h, lines * style["size"] * EMU_PER_PT * 12 // 1000 + 2 * style["margin"])
+
+
+def table_pages(columns, col_widths, max_h, header_h, style, min_row_h=emu(0.36)):
+    """Split columnar data into pages of (rows, row_heights) that fit in max_h.
+
+    columns holds one list of cell strings per column, all the same length.
+    """
+    pages = []
+    rows, heights, used = [], [], header_h
+    for cells in zip(*columns):
+        h = row_height(cells, col_widths, style, min_row_h)
+        if rows and used + h > max_h:
+            pages.append((rows, heights))
+            rows, heights, used = [], [], header_h
+        rows.append(list(cells))
+        heights.append(h)
+        used += h
+    if rows:
+        pages.append((rows, heights))
+    return pages
+
+
+def shape_table(sp_id, name, x, y, col_widths, header, rows, row_heights, header_h, header_style, body_style, band_style=None):
+    """A native table; band_style, if given, is used for every other body row."""
+    return {
+        "kind": "table",
+        "id": sp_id,
+        "name": name,
+        "x": x,
+        "y": y,
+        "w": sum(col_widths),
+        "h": header_h + sum(row_heights),
+        "col_widths": list(col_widths),
+        "header": list(header),
+        "header_h": header_h,
+        "rows": rows,
+        "row_heights": list(row_heights),
+        "styles": {"header": header_style, "body": body_style, "band": band_style or body_style},
+    }
@@ -0,0 +1,151 @@
+"""Minimal ZIP writer for OPC packages.
+
+Unlike ``zipfile`` it accepts members that were deflated ahead of time, so
+cached or shared parts can be spliced into a package without being
+recompressed.
+"""
+
+import struct
+import time
+import zlib
+from collections import namedtuple
+
+# A compressed package member: raw deflate bytes plus what the headers need.
+Part = namedtuple("Part", ["name", "crc", "size", "data"])
+# A central directory record; ``offset`` points at the member's local header.
+Entry = namedtuple("Entry", ["name", "crc", "csize", "size", "dos_time", "dos_date", "offset"])
+
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+END_RECORD = struct.Struct("<4s4H2LH")
+
+VERSION = 20
+DEFLATED = 8
+COMPRESS_LEVEL = 6
+
+
+def compress_chunks(name, chunks):
+    """Deflate an iterable of str/bytes chunks into a Part."""
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+    crc = 0
+    size = 0
+    out = []
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        crc = zlib.crc32(chunk, crc)
+        size += len(chunk)
+        out.append(compressor.compress(chunk))
+    out.append(compressor.flush())
+    return Part(name, crc, size, b"".join(out))
+
+
+def compress_part(name, data):
+    return compress_chunks(name, [data])
+
+
+def renamed(part, name):
+    return part._replace(name=name)
+
+
+def dos_timestamp(ts=None):
+    t = time.localtime(ts)
+    dos_date = (max(t.tm_year, 1980) - 1980) << 9 | t.tm_mon << 5 | t.tm_mday
+    dos_time = t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2
+    return dos_time, dos_date
+
+
+class PackageWriter:
+    """Write deflated members to ``fileobj`` and finish with a central directory.
+
+    Pass ``offset`` and ``entries`` to continue an existing archive whose
+    central directory starts at ``offset``.
+    """
+
+    def __init__(self, fileobj, offset=0, entries=None):
+        self.fileobj = fileobj
+        self.offset = offset
+        self.entries = list(entries or [])
+        self.dos_time, self.dos_date = dos_timestamp()
+
+    def add(self, name, data):
+        self.add_part(compress_part(name, data))
+
+    def add_chunks(self, name, chunks):
+        self.add_part(compress_chunks(name, chunks))
+
+    def add_part(self, part):
+        name = part.name.encode("utf-8")
+        header = LOCAL_HEADER.pack(
+            b"PK\x03\x04", VERSION, 0, 0, DEFLATED,
+            self.dos_time, self.dos_date,
+            part.crc, len(part.data), part.size,
+            len(name), 0,
+        )
+        self.fileobj.write(header)
+        self.fileobj.write(name)
+        self.fileobj.write(part.data)
+        self.entries.append(Entry(name, part.crc, len(part.data), part.size, self.dos_time, self.dos_date, self.offset))
+        self.offset += len(header) + len(name) + len(part.data)
+
+    def close(self):
+        cd_start = self.offset
+        for e in self.entries:
+            self.fileobj.write(CENTRAL_HEADER.pack(
+                b"PK\x01\x02", VERSION, 0, VERSION, 0, 0, DEFLATED,
+                e.dos_time, e.dos_date, e.crc, e.csize, e.size,
+                len(e.name), 0, 0, 0, 0, 0, e.offset,
+            ))
+            self.fileobj.write(e.name)
+            self.offset += CENTRAL_HEADER.size + len(e.name)
+        self.fileobj.write(END_RECORD.pack(
+            b"PK\x05\x06", 0, 0, len(self.entries), len(self.entries),
+            self.offset - cd_start, cd_start, 0,
+        ))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+
+def read_entries(fileobj):
+    """Parse the central directory; returns (entries, central directory offset)."""
+    fileobj.seek(0, 2)
+    end = fileobj.tell()
+    tail_len = min(end, END_RECORD.size + 0xFFFF)
+    fileobj.seek(end - tail_len)
+    tail = fileobj.read(tail_len)
+    pos = tail.rfind(b"PK\x05\x06")
+    if pos < 0:
+        raise ValueError("not a ZIP archive (no end of central directory record)")
+    _, _, _, _, count, cd_size, cd_offset, _ = END_RECORD.unpack_from(tail, pos)
+
+    fileobj.seek(cd_offset)
+    cd = fileobj.read(cd_size)
+    entries = []
+    pos = 0
+    for _ in range(count):
+        fields = CENTRAL_HEADER.unpack_from(cd, pos)
+        if fields[0] != b"PK\x01\x02" or fields[6] != DEFLATED:
+            raise ValueError("unsupported ZIP member (expected a deflated entry)")
+        _, _, _, _, _, _, _, dos_time, dos_date, crc, csize, size, name_len, extra_len, comment_len, _, _, _, offset = fields
+        pos += CENTRAL_HEADER.size
+        name = cd[pos:pos + name_len]
+        pos += name_len + extra_len + comment_len
+        entries.append(Entry(name, crc, csize, size, dos_time, dos_date, offset))
+    return entries, cd_offset
+
+
+def read_part(fileobj, entry):
+    """Return a member's raw deflated bytes as a Part, without inflating it."""
+    fileobj.seek(entry.offset)
+    header = LOCAL_HEADER.unpack(fileobj.read(LOCAL_HEADER.size))
+    fileobj.seek(header[-2] + header[-1], 1)
+    return Part(entry.name.decode("utf-8"), entry.crc, entry.size, fileobj.read(entry.csize))
+
+
+def inflate(part):
+    return zlib.decompress(part.data, -15)
@@ -0,0 +1,628 @@
+"""PresentationML serializer for slide descriptions from ``layout``."""
+
+import functools
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+from .cache import slide_key
+from .layout import COLORS, FONTS, SLIDE_H, SLIDE_W, emu, merge_runs
+from .package import PackageWriter, compress_chunks, compress_part, renamed
+
+XML_DECL = "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
+
+# Salted into slide cache keys; bump whenever the slide XML output changes.
+SERIALIZER_VERSION = 1
+
+
+def alpha_val(opacity):
+    """opacity: 0..1 -> 0..100000"""
+    return str(int(opacity * 100000))
+
+
+def srgb_clr(color_hex, opacity=1.0):
+    if opacity >= 0.999:
+        return f"<a:srgbClr val=\"{color_hex}\"/>"
+    return f"<a:srgbClr val=\"{color_hex}\"><a:alpha val=\"{alpha_val(opacity)}\"/></a:srgbClr>"
+
+
+def solid_fill(color_hex, opacity=1.0):
+    return f"<a:solidFill>{srgb_clr(color_hex, opacity)}</a:solidFill>"
+
+
+def line_xml(color_hex=None, width=12700, opacity=1.0):
+    if color_hex is None:
+        return "<a:ln><a:noFill/></a:ln>"
+    return f"<a:ln w=\"{width}\">{solid_fill(color_hex, opacity)}</a:ln>"
+
+
+def grad_fill(gradient):
+    stops = "".join(
+        f"<a:gs pos=\"{int(pos * 100000)}\">{srgb_clr(color, opacity)}</a:gs>"
+        for pos, color, opacity in gradient["stops"]
+    )
+    if gradient["gradient"] == "radial":
+        shade = "<a:path path=\"circle\"><a:fillToRect l=\"50000\" t=\"50000\" r=\"50000\" b=\"50000\"/></a:path>"
+    else:
+        shade = f"<a:lin ang=\"{int(gradient['angle'] * 60000)}\" scaled=\"0\"/>"
+    return f"<a:gradFill rotWithShape=\"1\"><a:gsLst>{stops}</a:gsLst>{shade}</a:gradFill>"
+
+
+def fill_xml(fill):
+    if not fill:
+        return "<a:noFill/>"
+    if isinstance(fill, dict):
+        return grad_fill(fill)
+    return solid_fill(fill[0], fill[1])
+
+
+def outer_shadow(color_hex, opacity=0.12, dist=120000, blur=300000, dir_deg=270):
+    # dir in degrees -> 60000 per degree
+    dir_val = int(dir_deg * 60000)
+    return (
+        f"<a:outerShdw dist=\"{dist}\" dir=\"{dir_val}\" blurRad=\"{blur}\" algn=\"ctr\" rotWithShape=\"0\">"
+        f"{srgb_clr(color_hex, opacity)}"
+        "</a:outerShdw>"
+    )
+
+
+# Shadow used for every shape with shadow=True.
+SHADOW = {"color_hex": COLORS["ink"], "opacity": 0.12, "dist": 90000, "blur": 240000, "dir_deg": 270}
+
+
+def effect_lst(shape):
+    # Children must follow the schema order: glow, outerShdw, softEdge.
+    effects = []
+    if shape.get("glow"):
+        color, radius, opacity = shape["glow"]
+        effects.append(f"<a:glow rad=\"{radius}\">{srgb_clr(color, opacity)}</a:glow>")
+    if shape.get("shadow"):
+        effects.append(outer_shadow(**SHADOW))
+    if shape.get("soft_edge"):
+        effects.append(f"<a:softEdge rad=\"{shape['soft_edge']}\"/>")
+    if not effects:
+        return ""
+    return "<a:effectLst>" + "".join(effects) + "</a:effectLst>"
+
+
+def run_xml(run):
+    rpr = [f"sz=\"{run['size']}\"", "lang=\"en-US\""]
+    if run["bold"]:
+        rpr.append("b=\"1\"")
+    if run["italic"]:
+        rpr.append("i=\"1\"")
+    rpr_str = " ".join(rpr)
+    return (
+        f"<a:r><a:rPr {rpr_str}><a:latin typeface=\"{escape(run['font'])}\"/><a:srgbClr val=\"{run['color']}\"/></a:rPr><a:t>{escape(run['text'])}</a:t></a:r>"
+    )
+
+
+def paragraph_xml(para, minimize=False):
+    align = para["align"]
+    runs = para["runs"]
+    if para["bullet"]:
+        ppr = (
+            f"<a:pPr algn=\"{align}\" marL=\"{emu(0.25)}\" indent=\"-{emu(0.12)}\">"
+            f"<a:buChar char=\"•\"/></a:pPr>"
+        )
+    elif minimize and align == "l":
+        ppr = ""
+    else:
+        ppr = f"<a:pPr algn=\"{align}\"/>"
+    if minimize:
+        # endParaRPr only sets the look of an empty trailing line; runs cover it.
+        return "<a:p>" + ppr + "".join(run_xml(r) for r in merge_runs(runs)) + "</a:p>"
+    return "<a:p>" + ppr + "".join(run_xml(r) for r in runs) + "<a:endParaRPr lang=\"en-US\"/>" + "</a:p>"
+
+
+def preset_geometry(shape):
+    if shape.get("ellipse"):
+        return "ellipse"
+    return "roundRect" if shape["round_rect"] else "rect"
+
+
+def theme_refs(shape):
+    """1-based fillStyleLst/lnStyleLst indexes matching the shape, 0 where none does."""
+    fill = shape["fill"]
+    line = shape["line"]
+    solid = fill and not isinstance(fill, dict)
+    fill_idx = THEME_FILL_STYLES.index(tuple(fill)) + 1 if solid and tuple(fill) in THEME_FILL_STYLES else 0
+    line_idx = THEME_LINE_STYLES.index(tuple(line)) + 1 if line and tuple(line) in THEME_LINE_STYLES else 0
+    return fill_idx, line_idx
+
+
+def sp_pr_xml(shape, minimize=False, refs=(0, 0)):
+    """Fills and lines referenced through refs (see theme_refs) are left to p:style.
+
+    When minimizing, absent fill and line markup already means none, so
+    explicit noFill elements and the empty avLst are dropped.
+    """
+    fill = shape["fill"]
+    line = shape["line"]
+    if minimize:
+        geom = f"<a:prstGeom prst=\"{preset_geometry(shape)}\"/>"
+        fill_part = fill_xml(fill) if fill and not refs[0] else ""
+        line_part = line_xml(*line) if line and not refs[1] else ""
+    else:
+        geom = f"<a:prstGeom prst=\"{preset_geometry(shape)}\"><a:avLst/></a:prstGeom>"
+        fill_part = fill_xml(fill)
+        line_part = line_xml(*line) if line else "<a:ln><a:noFill/></a:ln>"
+    return (
+        f"<p:spPr>"
+        f"<a:xfrm><a:off x=\"{shape['x']}\" y=\"{shape['y']}\"/><a:ext cx=\"{shape['w']}\" cy=\"{shape['h']}\"/></a:xfrm>"
+        f"{geom}"
+        f"{fill_part}"
+        f"{line_part}"
+        f"{effect_lst(shape)}"
+        f"</p:spPr>"
+    )
+
+
+def style_xml(refs):
+    fill_idx, line_idx = refs
+    return (
+        f"<p:style><a:lnRef idx=\"{line_idx}\"/><a:fillRef idx=\"{fill_idx}\"/>"
+        "<a:effectRef idx=\"0\"/><a:fontRef idx=\"minor\"/></p:style>"
+    )
+
+
+def shape_props(shape, minimize=False):
+    """spPr plus, when minimizing and the theme has a matching line, a p:style."""
+    if not minimize:
+        return sp_pr_xml(shape)
+    refs = theme_refs(shape)
+    # A p:style costs about as much as an inline line, so only a line match pays.
+    if refs[1]:
+        return sp_pr_xml(shape, True, refs) + style_xml(refs)
+    return sp_pr_xml(shape, True)
+
+
+def nv_sp_pr_xml(shape):
+    return f"<p:nvSpPr><p:cNvPr id=\"{shape['id']}\" name=\"{escape(shape['name'])}\"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>"
+
+
+def rect_xml(shape, minimize=False):
+    return f"<p:sp>{nv_sp_pr_xml(shape)}{shape_props(shape, minimize)}</p:sp>"
+
+
+def textbox_xml(shape, minimize=False):
+    ins = shape["margin"]
+    paras_xml = "".join(paragraph_xml(p, minimize) for p in shape["paragraphs"])
+    if minimize:
+        # wrap="square" and anchor="t" are the bodyPr defaults.
+        anchor = "" if shape["valign"] == "t" else f" anchor=\"{shape['valign']}\""
+        body_pr = f"<a:bodyPr{anchor} lIns=\"{ins}\" rIns=\"{ins}\" tIns=\"{ins}\" bIns=\"{ins}\"/>"
+        lst_style = ""
+    else:
+        body_pr = f"<a:bodyPr wrap=\"square\" anchor=\"{shape['valign']}\" lIns=\"{ins}\" rIns=\"{ins}\" tIns=\"{ins}\" bIns=\"{ins}\"/>"
+        lst_style = "<a:lstStyle/>"
+    return (
+        f"<p:sp>{nv_sp_pr_xml(shape)}{shape_props(shape, minimize)}"
+        f"<p:txBody>{body_pr}{lst_style}{paras_xml}</p:txBody>"
+        f"</p:sp>"
+    )
+
+
+# Hairline drawn under every table row.
+TABLE_RULE = (COLORS["ink"], 6350, 0.10)
+
+
+def cell_template(style, minimize=False):
+    """Split a cell's XML around its text so each cell costs one concatenation."""
+    m = style["margin"]
+    rpr = f"sz=\"{style['size']}\" lang=\"en-US\"" + (" b=\"1\"" if style["bold"] else "")
+    rule = f"<a:lnB w=\"{TABLE_RULE[1]}\">{solid_fill(TABLE_RULE[0], TABLE_RULE[2])}</a:lnB>"
+    fill = solid_fill(*style["fill"]) if style["fill"] else "<a:noFill/>"
+    head = (
+        "<a:tc><a:txBody><a:bodyPr/>" + ("" if minimize else "<a:lstStyle/>") + "<a:p>"
+        f"<a:r><a:rPr {rpr}><a:latin typeface=\"{escape(style['font'])}\"/><a:srgbClr val=\"{style['color']}\"/></a:rPr><a:t>"
+    )
+    tail = (
+        "</a:t></a:r></a:p></a:txBody>"
+        f"<a:tcPr marL=\"{m}\" marR=\"{m}\" marT=\"{m}\" marB=\"{m}\" anchor=\"ctr\">{rule}{fill}</a:tcPr></a:tc>"
+    )
+    return head, tail
+
+
+def table_xml(shape, minimize=False):
+    styles = shape["styles"]
+    header_head, header_tail = cell_template(styles["header"], minimize)
+    bands = [cell_template(styles["body"], minimize), cell_template(styles["band"], minimize)]
+
+    out = [
+        "<p:graphicFrame>"
+        f"<p:nvGraphicFramePr><p:cNvPr id=\"{shape['id']}\" name=\"{escape(shape['name'])}\"/>"
+        "<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp=\"1\"/></p:cNvGraphicFramePr><p:nvPr/></p:nvGraphicFramePr>"
+        f"<p:xfrm><a:off x=\"{shape['x']}\" y=\"{shape['y']}\"/><a:ext cx=\"{shape['w']}\" cy=\"{shape['h']}\"/></p:xfrm>"
+        "<a:graphic><a:graphicData uri=\"http://schemas.openxmlformats.org/drawingml/2006/table\">"
+        "<a:tbl><a:tblPr firstRow=\"1\" bandRow=\"1\"/><a:tblGrid>"
+        + "".join(f"<a:gridCol w=\"{w}\"/>" for w in shape["col_widths"])
+        + "</a:tblGrid>"
+    ]
+    if shape["header"]:
+        out.append(f"<a:tr h=\"{shape['header_h']}\">")
+        out.extend(header_head + escape(text) + header_tail for text in shape["header"])
+        out.append("</a:tr>")
+    for i, (cells, h) in enumerate(zip(shape["rows"], shape["row_heights"])):
+        head, tail = bands[i % 2]
+        out.append(f"<a:tr h=\"{h}\">")
+        out.extend(head + escape(text) + tail for text in cells)
+        out.append("</a:tr>")
+    out.append("</a:tbl></a:graphicData></a:graphic></p:graphicFrame>")
+    return "".join(out)
+
+
+SHAPE_WRITERS = {
+    "rect": rect_xml,
+    "textbox": textbox_xml,
+    "table": table_xml,
+}
+
+
+def shape_xml(shape, minimize=False):
+    return SHAPE_WRITERS[shape["kind"]](shape, minimize)
+
+
+def iter_slide_xml(shapes, minimize=False):
+    if minimize:
+        # The group transform and colour-map override are optional.
+        yield (
+            XML_DECL
+            + "<p:sld xmlns:a=\"http://schemas.openxmlformats.org/drawingml/2006/main\" "
+            "xmlns:r=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships\" "
+            "xmlns:p=\"http://schemas.openxmlformats.org/presentationml/2006/main\">"
+            "<p:cSld><p:spTree>"
+            "<p:nvGrpSpPr><p:cNvPr id=\"1\" name=\"\"/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr/>"
+        )
+        for shape in shapes:
+            yield shape_xml(shape, minimize=True)
+        yield "</p:spTree></p:cSld></p:sld>"
+        return
+    yield (
+        XML_DECL
+        + "<p:sld xmlns:a=\"http://schemas.openxmlformats.org/drawingml/2006/main\" "
+        "xmlns:r=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships\" "
+        "xmlns:p=\"http://schemas.openxmlformats.org/presentationml/2006/main\">"
+        "<p:cSld>"
+        "<p:spTree>"
+        "<p:nvGrpSpPr><p:cNvPr id=\"1\" name=\"\"/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>"
+        "<p:grpSpPr><a:xfrm><a:off x=\"0\" y=\"0\"/><a:ext cx=\"0\" cy=\"0\"/>"
+        "<a:chOff x=\"0\" y=\"0\"/><a:chExt cx=\"0\" cy=\"0\"/></a:xfrm></p:grpSpPr>"
+    )
+    for shape in shapes:
+        yield shape_xml(shape)
+    yield (
+        "</p:spTree>"
+        "</p:cSld>"
+        "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>"
+        "</p:sld>"
+    )
+
+
+def slide_xml(shapes, minimize=False):
+    return "".join(iter_slide_xml(shapes, minimize))
+
+
+def content_types_xml(slide_count, fonts=(), custom=False):
+    content_types = [
+        XML_DECL,
+        "<Types xmlns=\"http://schemas.openxmlformats.org/package/2006/content-types\">",
+        "<Default Extension=\"rels\" ContentType=\"application/vnd.openxmlformats-package.relationships+xml\"/>",
+        "<Default Extension=\"xml\" ContentType=\"application/xml\"/>",
+    ]
+    if fonts:
+        content_types.append("<Default Extension=\"fntdata\" ContentType=\"application/x-fontdata\"/>")
+    content_types += [
+        "<Override PartName=\"/ppt/presentation.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml\"/>",
+        "<Override PartName=\"/ppt/slideMasters/slideMaster1.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.presentationml.slideMaster+xml\"/>",
+        "<Override PartName=\"/ppt/slideLayouts/slideLayout1.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.presentationml.slideLayout+xml\"/>",
+        "<Override PartName=\"/ppt/theme/theme1.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.theme+xml\"/>",
+        "<Override PartName=\"/docProps/core.xml\" ContentType=\"application/vnd.openxmlformats-package.core-properties+xml\"/>",
+        "<Override PartName=\"/docProps/app.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.extended-properties+xml\"/>",
+    ]
+    if custom:
+        content_types.append(
+            "<Override PartName=\"/docProps/custom.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.custom-properties+xml\"/>"
+        )
+    for i in range(1, slide_count + 1):
+        content_types.append(
+            f"<Override PartName=\"/ppt/slides/slide{i}.xml\" ContentType=\"application/vnd.openxmlformats-officedocument.presentationml.slide+xml\"/>"
+        )
+    content_types.append("</Types>")
+    return "".join(content_types)
+
+
+rels_root = (
+    XML_DECL
+    + "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\">"
+    "<Relationship Id=\"rId1\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument\" Target=\"ppt/presentation.xml\"/>"
+    "<Relationship Id=\"rId2\" Type=\"http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties\" Target=\"docProps/core.xml\"/>"
+    "<Relationship Id=\"rId3\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/extended-properties\" Target=\"docProps/app.xml\"/>"
+    "</Relationships>"
+)
+
+rels_root_custom = rels_root.replace(
+    "</Relationships>",
+    "<Relationship Id=\"rId4\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/custom-properties\" Target=\"docProps/custom.xml\"/>"
+    "</Relationships>",
+)
+
+# Custom document property holding how many slides follow the turns (tables,
+# dossiers). append.append_slides refuses decks where it is non-zero.
+TRAILING_PROPERTY = "SlideKitTrailingSlides"
+
+
+def custom_xml(trailing):
+    return (
+        XML_DECL
+        + "<Properties xmlns=\"http://schemas.openxmlformats.org/officeDocument/2006/custom-properties\" "
+        "xmlns:vt=\"http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes\">"
+        f"<property fmtid=\"{{D5CDD505-2E9C-101B-9397-08002B2CF9AE}}\" pid=\"2\" name=\"{TRAILING_PROPERTY}\">"
+        f"<vt:i4>{trailing}</vt:i4></property>"
+        "</Properties>"
+    )
+
+
+def font_files(fonts):
+    """(part name, Part) for each embedded font file, numbered in deck order."""
+    files = []
+    for _, parts in fonts:
+        for part in parts.values():
+            files.append((f"ppt/fonts/font{len(files) + 1}.fntdata", part))
+    return files
+
+
+def embedded_font_lst(slide_count, fonts):
+    # Font relationships follow the master (rId1) and the slides.
+    rid = slide_count + 2
+    out = ["<p:embeddedFontLst>"]
+    for typeface, parts in fonts:
+        out.append(f"<p:embeddedFont><p:font typeface=\"{escape(typeface)}\"/>")
+        for style in parts:
+            out.append(f"<p:{style} r:id=\"rId{rid}\"/>")
+            rid += 1
+        out.append("</p:embeddedFont>")
+    out.append("</p:embeddedFontLst>")
+    return "".join(out)
+
+
+def presentation_xml(slide_count, fonts=()):
+    return (
+        XML_DECL
+        + "<p:presentation xmlns:a=\"http://schemas.openxmlformats.org/drawingml/2006/main\" "
+        "xmlns:r=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships\" "
+        "xmlns:p=\"http://schemas.openxmlformats.org/presentationml/2006/main\""
+        + (" embedTrueTypeFonts=\"1\" saveSubsetFonts=\"1\">" if fonts else ">")
+        + "<p:sldMasterIdLst><p:sldMasterId id=\"2147483648\" r:id=\"rId1\"/></p:sldMasterIdLst>"
+        "<p:sldIdLst>"
+        + "".join([f"<p:sldId id=\"{256+i}\" r:id=\"rId{i+1}\"/>" for i in range(1, slide_count + 1)])
+        + "</p:sldIdLst>"
+        f"<p:slideSize cx=\"{SLIDE_W}\" cy=\"{SLIDE_H}\" type=\"screen16x9\"/>"
+        "<p:notesSz cx=\"6858000\" cy=\"9144000\"/>"
+        + (embedded_font_lst(slide_count, fonts) if fonts else "")
+        + "</p:presentation>"
+    )
+
+
+def presentation_rels(slide_count, fonts=()):
+    return (
+        XML_DECL
+        + "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\">"
+        "<Relationship Id=\"rId1\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster\" Target=\"slideMasters/slideMaster1.xml\"/>"
+        + "".join([
+            f"<Relationship Id=\"rId{i+1}\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide\" Target=\"slides/slide{i}.xml\"/>"
+            for i in range(1, slide_count + 1)
+        ])
+        + "".join([
+            f"<Relationship Id=\"rId{slide_count + 1 + i}\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/font\" Target=\"{name[4:]}\"/>"
+            for i, (name, _) in enumerate(font_files(fonts), 1)
+        ])
+        + "</Relationships>"
+    )
+
+
+slide_master_xml = (
+    XML_DECL
+    + "<p:sldMaster xmlns:a=\"http://schemas.openxmlformats.org/drawingml/2006/main\" "
+    "xmlns:r=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships\" "
+    "xmlns:p=\"http://schemas.openxmlformats.org/presentationml/2006/main\">"
+    "<p:cSld>"
+    "<p:spTree>"
+    "<p:nvGrpSpPr><p:cNvPr id=\"1\" name=\"\"/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>"
+    "<p:grpSpPr><a:xfrm><a:off x=\"0\" y=\"0\"/><a:ext cx=\"0\" cy=\"0\"/>"
+    "<a:chOff x=\"0\" y=\"0\"/><a:chExt cx=\"0\" cy=\"0\"/></a:xfrm></p:grpSpPr>"
+    "</p:spTree>"
+    "</p:cSld>"
+    "<p:clrMap bg1=\"lt1\" tx1=\"dk1\" bg2=\"lt2\" tx2=\"dk2\" accent1=\"accent1\" accent2=\"accent2\" accent3=\"accent3\" accent4=\"accent4\" accent5=\"accent5\" accent6=\"accent6\" hlink=\"hlink\" folHlink=\"folHlink\"/>"
+    "<p:sldLayoutIdLst><p:sldLayoutId id=\"1\" r:id=\"rId1\"/></p:sldLayoutIdLst>"
+    "<p:txStyles>"
+    "<p:titleStyle><a:lvl1pPr algn=\"l\"/><a:defRPr sz=\"4400\"/></p:titleStyle>"
+    "<p:bodyStyle><a:lvl1pPr algn=\"l\"/><a:defRPr sz=\"2000\"/></p:bodyStyle>"
+    "<p:otherStyle><a:defRPr sz=\"1600\"/></p:otherStyle>"
+    "</p:txStyles>"
+    "</p:sldMaster>"
+)
+
+slide_master_rels = (
+    XML_DECL
+    + "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\">"
+    "<Relationship Id=\"rId1\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout\" Target=\"../slideLayouts/slideLayout1.xml\"/>"
+    "<Relationship Id=\"rId2\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme\" Target=\"../theme/theme1.xml\"/>"
+    "</Relationships>"
+)
+
+slide_layout_xml = (
+    XML_DECL
+    + "<p:sldLayout xmlns:a=\"http://schemas.openxmlformats.org/drawingml/2006/main\" "
+    "xmlns:r=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships\" "
+    "xmlns:p=\"http://schemas.openxmlformats.org/presentationml/2006/main\" type=\"blank\" preserve=\"1\">"
+    "<p:cSld name=\"Blank\">"
+    "<p:spTree>"
+    "<p:nvGrpSpPr><p:cNvPr id=\"1\" name=\"\"/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>"
+    "<p:grpSpPr><a:xfrm><a:off x=\"0\" y=\"0\"/><a:ext cx=\"0\" cy=\"0\"/>"
+    "<a:chOff x=\"0\" y=\"0\"/><a:chExt cx=\"0\" cy=\"0\"/></a:xfrm></p:grpSpPr>"
+    "</p:spTree>"
+    "</p:cSld>"
+    "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>"
+    "</p:sldLayout>"
+)
+
+slide_layout_rels = (
+    XML_DECL
+    + "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\">"
+    "<Relationship Id=\"rId1\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster\" Target=\"../slideMasters/slideMaster1.xml\"/>"
+    "</Relationships>"
+)
+
+# Theme format styles, in fillStyleLst/lnStyleLst order. Minimized slides point
+# at these by index, so they mirror the kit's most common card fills and borders.
+THEME_FILL_STYLES = [(COLORS["surface"], 1.0), (COLORS["surface2"], 1.0), (COLORS["surface3"], 1.0)]
+THEME_LINE_STYLES = [(COLORS["ink"], 12700, 0.08), (COLORS["ink"], 12700, 0.10), (COLORS["ink"], 25400, 0.12)]
+
+theme_xml = (
+    XML_DECL
+    + "<a:theme xmlns:a=\"http://schemas.openxmlformats.org/drawingml/2006/main\" name=\"PowerAI\">"
+    "<a:themeElements>"
+    "<a:clrScheme name=\"PowerAI\">"
+    f"<a:dk1><a:srgbClr val=\"{COLORS['ink']}\"/></a:dk1>"
+    f"<a:lt1><a:srgbClr val=\"{COLORS['surface']}\"/></a:lt1>"
+    f"<a:dk2><a:srgbClr val=\"{COLORS['ink2']}\"/></a:dk2>"
+    f"<a:lt2><a:srgbClr val=\"{COLORS['bg']}\"/></a:lt2>"
+    f"<a:accent1><a:srgbClr val=\"{COLORS['accent']}\"/></a:accent1>"
+    f"<a:accent2><a:srgbClr val=\"{COLORS['accent2']}\"/></a:accent2>"
+    f"<a:accent3><a:srgbClr val=\"{COLORS['accent3']}\"/></a:accent3>"
+    f"<a:accent4><a:srgbClr val=\"{COLORS['muted']}\"/></a:accent4>"
+    f"<a:accent5><a:srgbClr val=\"{COLORS['muted2']}\"/></a:accent5>"
+    f"<a:accent6><a:srgbClr val=\"{COLORS['stone500']}\"/></a:accent6>"
+    f"<a:hlink><a:srgbClr val=\"{COLORS['accent']}\"/></a:hlink>"
+    f"<a:folHlink><a:srgbClr val=\"{COLORS['accent']}\"/></a:folHlink>"
+    "</a:clrScheme>"
+    "<a:fontScheme name=\"PowerAI\">"
+    f"<a:majorFont><a:latin typeface=\"{FONTS['display']}\"/><a:ea typeface=\"\"/><a:cs typeface=\"\"/></a:majorFont>"
+    f"<a:minorFont><a:latin typeface=\"{FONTS['body']}\"/><a:ea typeface=\"\"/><a:cs typeface=\"\"/></a:minorFont>"
+    "</a:fontScheme>"
+    "<a:fmtScheme name=\"PowerAI\">"
+    "<a:fillStyleLst>"
+    + "".join(solid_fill(*f) for f in THEME_FILL_STYLES)
+    + "</a:fillStyleLst>"
+    "<a:lnStyleLst>"
+    + "".join(line_xml(*ln) for ln in THEME_LINE_STYLES)
+    + "</a:lnStyleLst>"
+    "<a:effectStyleLst>"
+    "<a:effectStyle><a:effectLst/></a:effectStyle>"
+    "<a:effectStyle><a:effectLst/></a:effectStyle>"
+    "<a:effectStyle><a:effectLst/></a:effectStyle>"
+    "</a:effectStyleLst>"
+    "<a:bgFillStyleLst>"
+    "<a:solidFill><a:srgbClr val=\"F3EFE7\"/></a:solidFill>"
+    "<a:solidFill><a:srgbClr val=\"FFFFFF\"/></a:solidFill>"
+    "<a:solidFill><a:srgbClr val=\"F7F4EE\"/></a:solidFill>"
+    "</a:bgFillStyleLst>"
+    "</a:fmtScheme>"
+    "</a:themeElements>"
+    "</a:theme>"
+)
+
+
+def core_xml(title, now=None):
+    if now is None:
+        now = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return (
+        XML_DECL
+        + "<cp:coreProperties xmlns:cp=\"http://schemas.openxmlformats.org/package/2006/metadata/core-properties\" "
+        "xmlns:dc=\"http://purl.org/dc/elements/1.1/\" xmlns:dcterms=\"http://purl.org/dc/terms/\" "
+        "xmlns:dcmitype=\"http://purl.org/dc/dcmitype/\" xmlns:xsi=\"http://www.w3.org/2001/XMLSchema-instance\">"
+        f"<dc:title>{escape(title)}</dc:title>"
+        "<dc:creator>Codex</dc:creator>"
+        f"<dcterms:created xsi:type=\"dcterms:W3CDTF\">{now}</dcterms:created>"
+        f"<dcterms:modified xsi:type=\"dcterms:W3CDTF\">{now}</dcterms:modified>"
+        "</cp:coreProperties>"
+    )
+
+
+def app_xml(slide_count):
+    return (
+        XML_DECL
+        + "<Properties xmlns=\"http://schemas.openxmlformats.org/officeDocument/2006/extended-properties\" "
+        "xmlns:vt=\"http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes\">"
+        "<Application>Codex</Application>"
+        "<Slides>" + str(slide_count) + "</Slides>"
+        "</Properties>"
+    )
+
+
+# slide rels template
+slide_rels_template = (
+    XML_DECL
+    + "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\">"
+    "<Relationship Id=\"rId1\" Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout\" Target=\"../slideLayouts/slideLayout1.xml\"/>"
+    "</Relationships>"
+)
+
+
+def compile_slide(shapes, cache=None, minimize=False):
+    """Serialize and deflate one slide into its (xml, rels) parts.
+
+    With a ``SlideCache`` the parts are looked up by the slide's content hash
+    first, so identical slides across decks are only compressed once.
+    """
+    key = None
+    if cache is not None:
+        key = slide_key(shapes, SERIALIZER_VERSION, minimize)
+        parts = cache.get(key)
+        if parts is not None:
+            return parts
+    parts = [
+        compress_chunks("xml", iter_slide_xml(shapes, minimize)),
+        compress_part("rels", slide_rels_template),
+    ]
+    if cache is not None:
+        cache.put(key, parts)
+    return parts
+
+
+@functools.lru_cache(maxsize=None)
+def shared_parts():
+    """Theme, master and layout parts; identical in every deck, so deflated once per process."""
+    return (
+        compress_part("_rels/.rels", rels_root),
+        compress_part("ppt/slideMasters/slideMaster1.xml", slide_master_xml),
+        compress_part("ppt/slideMasters/_rels/slideMaster1.xml.rels", slide_master_rels),
+        compress_part("ppt/slideLayouts/slideLayout1.xml", slide_layout_xml),
+        compress_part("ppt/slideLayouts/_rels/slideLayout1.xml.rels", slide_layout_rels),
+        compress_part("ppt/theme/theme1.xml", theme_xml),
+    )
+
+
+def write_package(out_path, count, slide_parts, title, fonts=(), trailing=0):
+    """Write a deck of ``count`` slides from an iterable of compiled (xml, rels) parts.
+
+    fonts is a list of (typeface, {style: Part}) from ``fonts.embed_fonts``;
+    trailing is the number of slides after the turns of a report deck.
+    """
+    root_rels, *shared = shared_parts()
+    with open(out_path, "wb") as f, PackageWriter(f) as z:
+        z.add("[Content_Types].xml", content_types_xml(count, fonts, custom=bool(trailing)))
+        if trailing:
+            z.add("_rels/.rels", rels_root_custom)
+        else:
+            z.add_part(root_rels)
+        z.add("docProps/core.xml", core_xml(title))
+        z.add("docProps/app.xml", app_xml(count))
+        if trailing:
+            z.add("docProps/custom.xml", custom_xml(trailing))
+        z.add("ppt/presentation.xml", presentation_xml(count, fonts))
+        z.add("ppt/_rels/presentation.xml.rels", presentation_rels(count, fonts))
+        for part in shared:
+            z.add_part(part)
+        for name, part in font_files(fonts):
+            z.add_part(renamed(part, name))
+
+        for i, (xml_part, rels_part) in enumerate(slide_parts, 1):
+            z.add_part(renamed(xml_part, f"ppt/slides/slide{i}.xml"))
+            z.add_part(renamed(rels_part, f"ppt/slides/_rels/slide{i}.xml.rels"))
+
+
+def write_pptx(slides, out_path, title="Power & AI Simulator Slide Kit", cache=None, minimize=False, fonts=(), trailing=0):
+    # A generator keeps only one slide's XML in memory at a time.
+    slide_parts = (compile_slide(shapes, cache, minimize) for shapes in slides)
+    write_package(out_path, len(slides), slide_parts, title, fonts, trailing)
@@ -0,0 +1,336 @@
+"""Game report decks built from an exported ``GameRecord`` (lib/game-store.ts).
+
+A report is the cover slide followed by one slide per turn, in turn order.
+``append.append_slides`` relies on that: a deck with N slides already holds
+the first N - 1 turns. Optional sections (agent dossiers, roster and action
+log tables) go after the turns; decks built with them record the count in a
+custom document property and ``append_slides`` refuses them.
+"""
+
+import json
+
+from .layout import (
+    COLORS, FONTS, SLIDE_H, SLIDE_W, cell_style, emu, paragraph, shape_rect, shape_table, shape_textbox, table_pages,
+    text_run,
+)
+
+MAX_NARRATION_CHARS = 1100
+MAX_ACTIONS = 8
+MAX_ACTION_CHARS = 140
+MAX_DOSSIER_STATES = 5
+MAX_DOSSIER_ACTIONS = 9
+
+
+def load_game(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def game_turns(record):
+    """Turn snapshots in order; older records only carry ``state.history``."""
+    turns = record.get("turns") or record.get("state", {}).get("history") or []
+    return sorted(turns, key=lambda t: t["turn"])
+
+
+def clip(text, limit):
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[:limit - 1].rstrip() + "…"
+
+
+def game_title(record):
+    return record.get("name") or record.get("scenarioName") or "Agent Wargame"
+
+
+def eyebrow(sp_id, name, label, x, y, w):
+    return shape_textbox(
+        sp_id, name, x, y, w, emu(0.45),
+        [paragraph([text_run(label, FONTS["body"], 1100, COLORS["stone500"], bold=True)])],
+        align="l", valign="ctr",
+        fill=(COLORS["surface"], 1.0),
+        line=(COLORS["ink"], 12700, 0.08),
+        round_rect=True,
+        margin=0.15,
+    )
+
+
+def cover_slide(record):
+    shapes = []
+    sp = 2
+    shapes.append(shape_rect(sp, "Background", 0, 0, SLIDE_W, SLIDE_H, fill=(COLORS["bg"], 1.0)))
+    sp += 1
+    shapes.append(eyebrow(sp, "Eyebrow", "GAME REPORT", emu(0.8), emu(0.7), emu(2.6)))
+    sp += 1
+    shapes.append(shape_textbox(
+        sp, "Title", emu(0.8), emu(1.6), emu(11.0), emu(1.4),
+        [paragraph([text_run(game_title(record), FONTS["display"], 4400, COLORS["ink"])])],
+    ))
+    sp += 1
+    if record.get("goal"):
+        shapes.append(shape_textbox(
+            sp, "Goal", emu(0.8), emu(3.1), emu(9.0), emu(1.2),
+            [
+                paragraph([text_run("YOUR GOAL", FONTS["body"], 900, COLORS["stone500"], bold=True)]),
+                paragraph([text_run(clip(record["goal"], 280), FONTS["body"], 1600, COLORS["muted"])]),
+            ],
+        ))
+        sp += 1
+    meta = [f"Game {record.get('id', '')}".strip()]
+    if record.get("scenarioName") and record.get("name"):
+        meta.append(record["scenarioName"])
+    if record.get("createdAt"):
+        meta.append(f"Started {record['createdAt'][:10]}")
+    shapes.append(shape_textbox(
+        sp, "Meta", emu(0.8), emu(6.4), emu(11.0), emu(0.5),
+        [paragraph([text_run("  •  ".join(meta), FONTS["mono"], 1100, COLORS["stone500"])])],
+    ))
+    sp += 1
+    return shapes
+
+
+def agent_names(record, snapshot):
+    names = {a["id"]: a["name"] for a in record.get("state", {}).get("agents", [])}
+    names.update({a["id"]: a["name"] for a in snapshot.get("agents", [])})
+    return names
+
+
+def turn_slide(record, snapshot):
+    shapes = []
+    sp = 2
+    shapes.append(shape_rect(sp, "Background", 0, 0, SLIDE_W, SLIDE_H, fill=(COLORS["bg"], 1.0)))
+    sp += 1
+    shapes.append(eyebrow(sp, f"Turn {snapshot['turn']}", f"TURN {snapshot['turn']}", emu(0.8), emu(0.6), emu(1.6)))
+    sp += 1
+    shapes.append(shape_textbox(
+        sp, "Headline", emu(0.8), emu(1.2), emu(7.2), emu(1.3),
+        [paragraph([text_run(clip(snapshot.get("headline", ""), 160), FONTS["display"], 2800, COLORS["ink"])])],
+    ))
+    sp += 1
+
+    narration = clip(snapshot.get("narration", ""), MAX_NARRATION_CHARS)
+    shapes.append(shape_textbox(
+        sp, "Narration", emu(0.8), emu(2.6), emu(7.2), emu(4.2),
+        [paragraph([text_run(narration, FONTS["body"], 1300, COLORS["muted"])])],
+    ))
+    sp += 1
+
+    actions = snapshot.get("agentActions", [])
+    if actions:
+        names = agent_names(record, snapshot)
+        paras = [paragraph([text_run("AGENT ACTIONS", FONTS["body"], 900, COLORS["stone500"], bold=True)])]
+        for act in actions[:MAX_ACTIONS]:
+            name = names.get(act["agentId"], act["agentId"])
+            paras.append(paragraph([
+                text_run(f"{name}: ", FONTS["body"], 1100, COLORS["ink"], bold=True),
+                text_run(clip(act["action"], MAX_ACTION_CHARS), FONTS["body"], 1100, COLORS["muted"]),
+            ], bullet=True))
+        if len(actions) > MAX_ACTIONS:
+            paras.append(paragraph([
+                text_run(f"+{len(actions) - MAX_ACTIONS} more", FONTS["body"], 1000, COLORS["stone500"])
+            ]))
+        shapes.append(shape_textbox(
+            sp, "Agent Actions", emu(8.4), emu(0.6), emu(4.1), emu(6.3), paras,
+            align="l", valign="t",
+            fill=(COLORS["surface2"], 1.0),
+            line=(COLORS["ink"], 12700, 0.08),
+            round_rect=True,
+            margin=0.16,
+        ))
+        sp += 1
+    return shapes
+
+
+def agent_index(record):
+    """Per-agent timelines from one pass over the game.
+
+    Returns {agentId: {"name", "type", "state", "turns": {turn: {"state", "actions"}}}}
+    in roster order, where "state" is the agent's latest state. Snapshot
+    actions win; ``actionHistory`` only fills turns that have no snapshot, as
+    in records that only carry ``state.history``.
+    """
+    index = {}
+
+    def entry(agent):
+        info = index.setdefault(agent["id"], {"name": agent["id"], "type": "", "state": "", "turns": {}})
+        info["name"] = agent.get("name") or info["name"]
+        info["type"] = agent.get("type") or info["type"]
+        info["state"] = agent.get("state") or info["state"]
+        return info
+
+    def slot(info, turn):
+        return info["turns"].setdefault(turn, {"state": None, "actions": []})
+
+    snapshots = game_turns(record)
+    for snapshot in snapshots:
+        for agent in snapshot.get("agents", []):
+            slot(entry(agent), snapshot["turn"])["state"] = agent.get("state")
+        for act in snapshot.get("agentActions", []):
+            info = index.get(act["agentId"]) or entry({"id": act["agentId"]})
+            slot(info, snapshot["turn"])["actions"].append(act["action"])
+
+    # state.history entries carry no agents or actions, so they leave their turn to actionHistory.
+    covered = {s["turn"] for s in snapshots if s.get("agentActions") or s.get("agents")}
+    roster = record.get("state", {}).get("agents", [])
+    for agent in roster:
+        # The live roster is newer than any snapshot.
+        info = entry(agent)
+        for item in agent.get("actionHistory", []):
+            if item["turn"] not in covered:
+                slot(info, item["turn"])["actions"].append(item["action"])
+
+    # Roster order first, then agents that only ever appeared in snapshots.
+    order = [a["id"] for a in roster]
+    listed = set(order)
+    order += [agent_id for agent_id in index if agent_id not in listed]
+    return {agent_id: index[agent_id] for agent_id in order}
+
+
+def dossier_slide(info):
+    shapes = []
+    sp = 2
+    shapes.append(shape_rect(sp, "Background", 0, 0, SLIDE_W, SLIDE_H, fill=(COLORS["bg"], 1.0)))
+    sp += 1
+    shapes.append(eyebrow(sp, "Eyebrow", "AGENT DOSSIER", emu(0.8), emu(0.6), emu(2.4)))
+    sp += 1
+    shapes.append(shape_textbox(
+        sp, "Name", emu(0.8), emu(1.2), emu(11.0), emu(0.9),
+        [paragraph([text_run(info["name"], FONTS["display"], 3600, COLORS["ink"])])],
+    ))
+    sp += 1
+
+    turns = sorted(info["turns"].items())
+    acted = [(t, action) for t, entry in turns for action in entry["actions"]]
+    meta = [info["type"]] if info["type"] else []
+    meta.append(f"{len(acted)} actions")
+    if turns:
+        meta.append(f"Turns {turns[0][0]}–{turns[-1][0]}")
+    shapes.append(shape_textbox(
+        sp, "Meta", emu(0.8), emu(2.05), emu(11.0), emu(0.45),
+        [paragraph([text_run("  •  ".join(meta), FONTS["mono"], 1100, COLORS["stone500"])])],
+    ))
+    sp += 1
+
+    # Only turns where the state changed; the latest state always closes the list.
+    changes = []
+    for t, entry in turns:
+        if entry["state"] and (not changes or changes[-1][1] != entry["state"]):
+            changes.append((t, entry["state"]))
+    if info["state"] and (not changes or changes[-1][1] != info["state"]):
+        changes.append(("Now", info["state"]))
+    paras = [paragraph([text_run("STATE", FONTS["body"], 900, COLORS["stone500"], bold=True)])]
+    if len(changes) > MAX_DOSSIER_STATES:
+        paras.append(paragraph([
+            text_run(f"{len(changes) - MAX_DOSSIER_STATES} earlier changes", FONTS["body"], 1000, COLORS["stone500"])
+        ]))
+    for t, state in changes[-MAX_DOSSIER_STATES:]:
+        label = t if t == "Now" else f"T{t:02d}"
+        paras.append(paragraph([
+            text_run(f"{label}  ", FONTS["mono"], 1000, COLORS["stone500"]),
+            text_run(clip(state, 220), FONTS["body"], 1100, COLORS["ink2"]),
+        ]))
+    shapes.append(shape_textbox(
+        sp, "State", emu(0.8), emu(2.7), emu(5.6), emu(4.2), paras,
+        align="l", valign="t",
+        fill=(COLORS["surface"], 1.0),
+        line=(COLORS["ink"], 12700, 0.08),
+        round_rect=True,
+        margin=0.16,
+    ))
+    sp += 1
+
+    paras = [paragraph([text_run("ACTIONS", FONTS["body"], 900, COLORS["stone500"], bold=True)])]
+    if len(acted) > MAX_DOSSIER_ACTIONS:
+        paras.append(paragraph([
+            text_run(f"{len(acted) - MAX_DOSSIER_ACTIONS} earlier actions", FONTS["body"], 1000, COLORS["stone500"])
+        ]))
+    for t, action in acted[-MAX_DOSSIER_ACTIONS:]:
+        paras.append(paragraph([
+            text_run(f"T{t:02d}: ", FONTS["body"], 1100, COLORS["ink"], bold=True),
+            text_run(clip(action, MAX_ACTION_CHARS), FONTS["body"], 1100, COLORS["muted"]),
+        ], bullet=True))
+    shapes.append(shape_textbox(
+        sp, "Actions", emu(6.7), emu(2.7), emu(5.8), emu(4.2), paras,
+        align="l", valign="t",
+        fill=(COLORS["surface2"], 1.0),
+        line=(COLORS["ink"], 12700, 0.08),
+        round_rect=True,
+        margin=0.16,
+    ))
+    sp += 1
+    return shapes
+
+
+def dossier_slides(record):
+    return [dossier_slide(info) for info in agent_index(record).values()]
+
+
+TABLE_HEADER = cell_style(FONTS["body"], 900, COLORS["stone500"], bold=True, fill=(COLORS["surface3"], 1.0))
+TABLE_BODY = cell_style(FONTS["body"], 1000, COLORS["ink2"], fill=(COLORS["surface"], 1.0))
+TABLE_BAND = cell_style(FONTS["body"], 1000, COLORS["ink2"], fill=(COLORS["surface2"], 1.0))
+TABLE_X = emu(0.8)
+TABLE_Y = emu(1.3)
+TABLE_MAX_H = SLIDE_H - TABLE_Y - emu(0.5)
+TABLE_HEADER_H = emu(0.4)
+
+
+def table_slides(title, header, columns, col_widths):
+    """One slide per page of a table, paged so rows never run off the slide."""
+    pages = table_pages(columns, col_widths, TABLE_MAX_H, TABLE_HEADER_H, TABLE_BODY)
+    slides = []
+    for page, (rows, heights) in enumerate(pages, 1):
+        label = title if len(pages) == 1 else f"{title} ({page}/{len(pages)})"
+        shapes = [
+            shape_rect(2, "Background", 0, 0, SLIDE_W, SLIDE_H, fill=(COLORS["bg"], 1.0)),
+            shape_textbox(
+                3, "Table Title", emu(0.8), emu(0.5), emu(11.0), emu(0.6),
+                [paragraph([text_run(label, FONTS["display"], 3200, COLORS["ink"])])],
+            ),
+            shape_table(
+                4, title, TABLE_X, TABLE_Y, col_widths, header, rows, heights, TABLE_HEADER_H,
+                TABLE_HEADER, TABLE_BODY, TABLE_BAND,
+            ),
+        ]
+        slides.append(shapes)
+    return slides
+
+
+def roster_slides(record):
+    agents = record.get("state", {}).get("agents", [])
+    columns = [
+        [a["name"] for a in agents],
+        [a.get("type", "") for a in agents],
+        [clip(a.get("state", ""), 400) for a in agents],
+    ]
+    return table_slides("Agent Roster", ["AGENT", "TYPE", "STATE"], columns, [emu(2.6), emu(2.0), emu(7.1)])
+
+
+def action_log_slides(record):
+    names = {a["id"]: a["name"] for a in record.get("state", {}).get("agents", [])}
+    turn_col, headline_col, agent_col, action_col = [], [], [], []
+    for snapshot in game_turns(record):
+        names.update({a["id"]: a["name"] for a in snapshot.get("agents", [])})
+        for i, act in enumerate(snapshot.get("agentActions", [])):
+            # Turn and headline only head the first row of each turn.
+            turn_col.append(f"T{snapshot['turn']:02d}" if i == 0 else "")
+            headline_col.append(clip(snapshot.get("headline", ""), 120) if i == 0 else "")
+            agent_col.append(names.get(act["agentId"], act["agentId"]))
+            action_col.append(clip(act["action"], 240))
+    return table_slides(
+        "Action Log", ["TURN", "HEADLINE", "AGENT", "ACTION"],
+        [turn_col, headline_col, agent_col, action_col],
+        [emu(0.8), emu(3.6), emu(2.0), emu(5.3)],
+    )
+
+
+def report_slides(record, first_turn_index=0, tables=False, dossiers=False):
+    """Cover plus turn slides; pass ``first_turn_index`` to get only later turns."""
+    turns = game_turns(record)
+    slides = [cover_slide(record)] if first_turn_index == 0 else []
+    slides.extend(turn_slide(record, t) for t in turns[first_turn_index:])
+    if dossiers:
+        slides.extend(dossier_slides(record))
+    if tables:
+        slides.extend(roster_slides(record))
+        slides.extend(action_log_slides(record))
+    return slides
@@ -0,0 +1,264 @@
+"""SVG/HTML serializer for slide descriptions from ``layout``.
+
+Coordinates are converted from EMU to points, so each slide is a
+960x540 viewBox. Text is laid out by the browser inside ``foreignObject``
+so that wrapping matches the PPTX text boxes.
+"""
+
+import math
+from xml.sax.saxutils import escape
+
+from .layout import EMU_PER_PT, FONTS, ROUND_RECT_ADJ, SLIDE_H, SLIDE_W, emu
+from .pptx import SHADOW, TABLE_RULE
+
+XHTML_NS = "http://www.w3.org/1999/xhtml"
+
+TEXT_ALIGN = {"l": "left", "c": "center", "ctr": "center", "r": "right", "just": "justify"}
+ANCHOR = {"t": "flex-start", "ctr": "center", "b": "flex-end"}
+GENERIC_FAMILY = {FONTS["display"]: "serif", FONTS["mono"]: "monospace"}
+
+
+def pt(value):
+    text = f"{value / EMU_PER_PT:.2f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def corner_radius(shape):
+    if not shape["round_rect"]:
+        return 0
+    return min(shape["w"], shape["h"]) * ROUND_RECT_ADJ // 100000
+
+
+def gradient_def(grad_id, gradient):
+    stops = "".join(
+        f"<stop offset=\"{pos:g}\" stop-color=\"#{color}\" stop-opacity=\"{opacity:g}\"/>"
+        for pos, color, opacity in gradient["stops"]
+    )
+    if gradient["gradient"] == "radial":
+        return f"<radialGradient id=\"{grad_id}\" cx=\"50%\" cy=\"50%\" r=\"50%\">{stops}</radialGradient>"
+    # DrawingML angles run clockwise from the +x axis, as do SVG's in y-down space.
+    angle = math.radians(gradient["angle"])
+    dx, dy = math.cos(angle) / 2, math.sin(angle) / 2
+    return (
+        f"<linearGradient id=\"{grad_id}\" x1=\"{0.5 - dx:.4g}\" y1=\"{0.5 - dy:.4g}\" "
+        f"x2=\"{0.5 + dx:.4g}\" y2=\"{0.5 + dy:.4g}\">{stops}</linearGradient>"
+    )
+
+
+def effects_filter(filter_id, shape):
+    """One filter chaining soft edge, glow and drop shadow, or "" if none apply."""
+    soft_edge = shape.get("soft_edge")
+    glow = shape.get("glow")
+    shadow = shape.get("shadow")
+    if not (soft_edge or glow or shadow):
+        return ""
+    steps = []
+    layers = []
+    src = "SourceGraphic"
+    if soft_edge:
+        steps.append(
+            f"<feGaussianBlur in=\"SourceAlpha\" stdDeviation=\"{pt(soft_edge / 2)}\" result=\"edge\"/>"
+            "<feComposite in=\"SourceGraphic\" in2=\"edge\" operator=\"in\" result=\"soft\"/>"
+        )
+        src = "soft"
+    if shadow:
+        angle = math.radians(SHADOW["dir_deg"])
+        dx = SHADOW["dist"] * math.cos(angle)
+        dy = SHADOW["dist"] * math.sin(angle)
+        steps.append(
+            f"<feGaussianBlur in=\"{src}\" stdDeviation=\"{pt(SHADOW['blur'] / 2)}\"/>"
+            f"<feOffset dx=\"{pt(dx)}\" dy=\"{pt(dy)}\" result=\"cast\"/>"
+            f"<feFlood flood-color=\"#{SHADOW['color_hex']}\" flood-opacity=\"{SHADOW['opacity']:g}\"/>"
+            "<feComposite in2=\"cast\" operator=\"in\" result=\"shadow\"/>"
+        )
+        layers.append("shadow")
+    if glow:
+        color, radius, opacity = glow
+        steps.append(
+            f"<feMorphology in=\"{src}\" operator=\"dilate\" radius=\"{pt(radius / 2)}\" result=\"spread\"/>"
+            f"<feGaussianBlur in=\"spread\" stdDeviation=\"{pt(radius / 2)}\" result=\"halo\"/>"
+            f"<feFlood flood-color=\"#{color}\" flood-opacity=\"{opacity:g}\"/>"
+            "<feComposite in2=\"halo\" operator=\"in\" result=\"glow\"/>"
+        )
+        layers.insert(0, "glow")
+    layers.append(src)
+    merge = "".join(f"<feMergeNode in=\"{layer}\"/>" for layer in layers)
+    return (
+        f"<filter id=\"{filter_id}\" x=\"-50%\" y=\"-50%\" width=\"200%\" height=\"200%\">"
+        f"{''.join(steps)}<feMerge>{merge}</feMerge></filter>"
+    )
+
+
+def rect_svg(shape, slide_id):
+    fill = shape["fill"]
+    line = shape["line"]
+    if not fill and not line and not shape.get("shadow") and not shape.get("glow"):
+        return ""
+    defs = []
+    ref = f"{slide_id}-sp{shape['id']}"
+    x, y, w, h = shape["x"], shape["y"], shape["w"], shape["h"]
+    if shape.get("ellipse"):
+        tag = "ellipse"
+        attrs = [f"cx=\"{pt(x + w / 2)}\"", f"cy=\"{pt(y + h / 2)}\"", f"rx=\"{pt(w / 2)}\"", f"ry=\"{pt(h / 2)}\""]
+    else:
+        tag = "rect"
+        attrs = [f"x=\"{pt(x)}\"", f"y=\"{pt(y)}\"", f"width=\"{pt(w)}\"", f"height=\"{pt(h)}\""]
+        radius = corner_radius(shape)
+        if radius:
+            attrs.append(f"rx=\"{pt(radius)}\"")
+    if isinstance(fill, dict):
+        defs.append(gradient_def(f"{ref}-fill", fill))
+        attrs.append(f"fill=\"url(#{ref}-fill)\"")
+    elif fill:
+        attrs.append(f"fill=\"#{fill[0]}\"")
+        if fill[1] < 0.999:
+            attrs.append(f"fill-opacity=\"{fill[1]:g}\"")
+    else:
+        attrs.append("fill=\"none\"")
+    if line:
+        attrs.append(f"stroke=\"#{line[0]}\" stroke-width=\"{pt(line[1])}\"")
+        if line[2] < 0.999:
+            attrs.append(f"stroke-opacity=\"{line[2]:g}\"")
+    effects = effects_filter(f"{ref}-fx", shape)
+    if effects:
+        defs.append(effects)
+        attrs.append(f"filter=\"url(#{ref}-fx)\"")
+    defs_xml = f"<defs>{''.join(defs)}</defs>" if defs else ""
+    return f"{defs_xml}<{tag} {' '.join(attrs)}/>"
+
+
+def run_html(run):
+    font = run["font"]
+    style = [
+        f"font-family:'{font}',{GENERIC_FAMILY.get(font, 'sans-serif')}",
+        f"font-size:{run['size'] / 100:g}pt",
+        f"color:#{run['color']}",
+    ]
+    if run["bold"]:
+        style.append("font-weight:700")
+    if run["italic"]:
+        style.append("font-style:italic")
+    return f"<span style=\"{escape(';'.join(style))}\">{escape(run['text'])}</span>"
+
+
+def paragraph_html(para):
+    style = [f"text-align:{TEXT_ALIGN.get(para['align'], 'left')}", "margin:0"]
+    bullet = ""
+    if para["bullet"]:
+        style.append(f"padding-left:{pt(emu(0.25))}pt")
+        style.append(f"text-indent:-{pt(emu(0.12))}pt")
+        bullet = f"<span style=\"display:inline-block;text-indent:0;width:{pt(emu(0.12))}pt\">•</span>"
+    runs = "".join(run_html(r) for r in para["runs"]) or "<br/>"
+    return f"<p style=\"{';'.join(style)}\">{bullet}{runs}</p>"
+
+
+def textbox_svg(shape, slide_id):
+    ins = pt(shape["margin"])
+    box_style = (
+        "box-sizing:border-box;width:100%;height:100%;overflow:hidden;"
+        f"padding:{ins}pt;display:flex;flex-direction:column;"
+        f"justify-content:{ANCHOR.get(shape['valign'], 'flex-start')};line-height:1.2"
+    )
+    paras = "".join(paragraph_html(p) for p in shape["paragraphs"])
+    return (
+        rect_svg(shape, slide_id)
+        + f"<foreignObject x=\"{pt(shape['x'])}\" y=\"{pt(shape['y'])}\" width=\"{pt(shape['w'])}\" height=\"{pt(shape['h'])}\">"
+        f"<div xmlns=\"{XHTML_NS}\" style=\"{box_style}\"><div>{paras}</div></div>"
+        "</foreignObject>"
+    )
+
+
+def rgba(color_hex, opacity=1.0):
+    r, g, b = (int(color_hex[i:i + 2], 16) for i in (0, 2, 4))
+    return f"rgba({r},{g},{b},{opacity:g})"
+
+
+def cell_css(style):
+    css = [
+        f"font-family:'{style['font']}',{GENERIC_FAMILY.get(style['font'], 'sans-serif')}",
+        f"font-size:{style['size'] / 100:g}pt",
+        f"color:#{style['color']}",
+        f"padding:0 {pt(style['margin'])}pt",
+        f"border-bottom:{pt(TABLE_RULE[1])}pt solid {rgba(TABLE_RULE[0], TABLE_RULE[2])}",
+        "overflow:hidden;vertical-align:middle;line-height:1.2",
+    ]
+    if style["bold"]:
+        css.append("font-weight:700")
+    if style["fill"]:
+        css.append(f"background:{rgba(*style['fill'])}")
+    return escape(";".join(css))
+
+
+def table_svg(shape, slide_id):
+    styles = shape["styles"]
+    header_td = f"<td style=\"{cell_css(styles['header'])}\">"
+    band_tds = [f"<td style=\"{cell_css(styles['body'])}\">", f"<td style=\"{cell_css(styles['band'])}\">"]
+
+    out = [
+        f"<foreignObject x=\"{pt(shape['x'])}\" y=\"{pt(shape['y'])}\" width=\"{pt(shape['w'])}\" height=\"{pt(shape['h'])}\">"
+        f"<table xmlns=\"{XHTML_NS}\" style=\"table-layout:fixed;border-collapse:collapse;width:{pt(shape['w'])}pt\"><colgroup>"
+        + "".join(f"<col style=\"width:{pt(w)}pt\"/>" for w in shape["col_widths"])
+        + "</colgroup>"
+    ]
+    if shape["header"]:
+        out.append(f"<tr style=\"height:{pt(shape['header_h'])}pt\">")
+        out.extend(header_td + escape(text) + "</td>" for text in shape["header"])
+        out.append("</tr>")
+    for i, (cells, h) in enumerate(zip(shape["rows"], shape["row_heights"])):
+        td = band_tds[i % 2]
+        out.append(f"<tr style=\"height:{pt(h)}pt\">")
+        out.extend(td + escape(text) + "</td>" for text in cells)
+        out.append("</tr>")
+    out.append("</table></foreignObject>")
+    return "".join(out)
+
+
+SHAPE_WRITERS = {
+    "rect": rect_svg,
+    "textbox": textbox_svg,
+    "table": table_svg,
+}
+
+
+def shape_svg(shape, slide_id):
+    return SHAPE_WRITERS[shape["kind"]](shape, slide_id)
+
+
+def iter_slide_svg(shapes, slide_id="s1", xml_decl=True):
+    if xml_decl:
+        yield "<?xml version=\"1.0\" encoding=\"UTF-8\"?>"
+    yield (
+        f"<svg xmlns=\"http://www.w3.org/2000/svg\" id=\"{slide_id}\" "
+        f"viewBox=\"0 0 {pt(SLIDE_W)} {pt(SLIDE_H)}\" width=\"{pt(SLIDE_W)}\" height=\"{pt(SLIDE_H)}\">"
+    )
+    for shape in shapes:
+        yield shape_svg(shape, slide_id)
+    yield "</svg>"
+
+
+def write_svg(shapes, out):
+    """Stream a single slide to a text file object."""
+    for chunk in iter_slide_svg(shapes):
+        out.write(chunk)
+
+
+def iter_html(slides, title="Slides"):
+    yield (
+        "<!DOCTYPE html>"
+        "<html lang=\"en\"><head><meta charset=\"utf-8\"/>"
+        f"<title>{escape(title)}</title>"
+        "<style>"
+        "body{margin:0;padding:24px;background:#1C1917}"
+        "svg{display:block;width:100%;max-width:1280px;height:auto;margin:0 auto 24px;"
+        "box-shadow:0 8px 24px rgba(0,0,0,.35)}"
+        "</style></head><body>"
+    )
+    for i, shapes in enumerate(slides, 1):
+        yield from iter_slide_svg(shapes, slide_id=f"slide{i}", xml_decl=False)
+    yield "</body></html>"
+
+
+def write_html(slides, out_path, title="Slides"):
+    with open(out_path, "w", encoding="utf-8") as f:
+        for chunk in iter_html(slides, title):
+            f.write(chunk)
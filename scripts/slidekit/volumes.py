@@ -0,0 +1,226 @@
+"""Split a long deck into volumes plus an index deck and a JSON manifest.
+
+Slides are compiled in parallel worker processes (through the slide cache
+when one is given), grouped into volumes by slide count or by compressed
+byte budget, and each volume is written from those parts on a thread pool.
+Every volume reuses the same deflated theme/master/layout parts.
+
+The manifest records a digest per volume. On the next run a volume whose
+digest is unchanged and whose file still exists is neither recompiled nor
+rewritten, so appending turns to a long game only touches the last volume.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from . import fonts as font_embed
+from .cache import SlideCache, slide_key
+from .layout import emu
+from .pptx import SERIALIZER_VERSION, compile_slide, shared_parts, write_package, write_pptx
+from .report import table_slides
+
+# Local header + central directory record for a slide's two members, names included.
+SLIDE_OVERHEAD = 2 * (30 + 46 + 2 * 36)
+
+# The slide cache of the current worker process, opened once by init_worker.
+worker_cache = None
+
+
+def init_worker(cache_dir, cache_max_bytes):
+    global worker_cache
+    worker_cache = SlideCache(cache_dir, cache_max_bytes) if cache_dir else None
+
+
+def compile_chunk(job, cache=None):
+    slides, minimize = job
+    cache = cache or worker_cache
+    before = cache.stats() if cache else None
+    parts = [compile_slide(shapes, cache, minimize) for shapes in slides]
+    if cache is None:
+        return parts, None
+    after = cache.stats()
+    return parts, {name: after[name] - before[name] for name in ("hits", "misses", "evictions")}
+
+
+def compile_parallel(slides, indexes, cache_dir, cache_max_bytes, minimize, workers, stats, cache=None):
+    """Compile ``slides[i]`` for each index; returns {index: (xml, rels)}.
+
+    With one worker everything runs in this process through ``cache``;
+    otherwise each worker process opens ``cache_dir`` once.
+    """
+    indexes = list(indexes)
+    if not indexes:
+        return {}
+    chunk = max(1, -(-len(indexes) // (workers * 4)))
+    batches = [indexes[i:i + chunk] for i in range(0, len(indexes), chunk)]
+    jobs = [([slides[i] for i in batch], minimize) for batch in batches]
+    if workers == 1:
+        results = [compile_chunk(job, cache) for job in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(cache_dir, cache_max_bytes),
+        ) as pool:
+            results = list(pool.map(compile_chunk, jobs))
+    compiled = {}
+    for batch, (parts, chunk_stats) in zip(batches, results):
+        compiled.update(zip(batch, parts))
+        if chunk_stats:
+            for name in chunk_stats:
+                stats[name] += chunk_stats[name]
+    return compiled
+
+
+def plan_by_count(count, max_slides):
+    return [list(range(i, min(i + max_slides, count))) for i in range(0, count, max_slides)]
+
+
+def plan_by_bytes(sizes, max_bytes, max_slides=None):
+    """Greedy split so each volume's compressed size stays within max_bytes."""
+    base = sum(len(p.data) for p in shared_parts()) + 4096
+    groups, group, used = [], [], base
+    for i, size in enumerate(sizes):
+        full = group and (used + size > max_bytes or (max_slides and len(group) >= max_slides))
+        if full:
+            groups.append(group)
+            group, used = [], base
+        group.append(i)
+        used += size
+    if group:
+        groups.append(group)
+    return groups
+
+
+def volume_digest(title, number, keys, salt=""):
+    h = hashlib.sha256(f"{title}\0{number}\0{SERIALIZER_VERSION}\0{salt}".encode("utf-8"))
+    for key in keys:
+        h.update(key.encode("ascii"))
+    return h.hexdigest()
+
+
+def load_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def index_slides(title, volumes):
+    rows = [
+        [str(v["volume"]) for v in volumes],
+        [v["file"] for v in volumes],
+        [f"{v['first_slide']}–{v['last_slide']}" for v in volumes],
+        [f"T{v['first_turn']}–T{v['last_turn']}" if v["first_turn"] is not None else "" for v in volumes],
+    ]
+    return table_slides(
+        f"{title} · Volumes", ["VOLUME", "FILE", "SLIDES", "TURNS"], rows,
+        [emu(1.2), emu(6.1), emu(2.2), emu(2.2)],
+    )
+
+
+def write_volumes(slides, out_base, title, turns=None, max_slides=None, max_bytes=None,
+                  cache_dir=None, cache_max_bytes=512 * 1024 * 1024, minimize=False, workers=None, font_dir=None):
+    """Write ``out_base``.volNNN.pptx files, ``out_base``.index.pptx and ``out_base``.manifest.json.
+
+    turns gives the turn number shown on each slide (None for non-turn slides).
+    With font_dir, each volume embeds font subsets for its own slides.
+    Returns (manifest, stats) where stats counts rewritten volumes and
+    slide cache hits, misses and evictions across the worker processes.
+    """
+    if not max_slides and not max_bytes:
+        raise ValueError("write_volumes needs max_slides or max_bytes")
+    workers = workers or os.cpu_count() or 1
+    turns = turns or [None] * len(slides)
+    out_dir = os.path.dirname(out_base) or "."
+    stem = os.path.basename(out_base)
+    manifest_path = f"{out_base}.manifest.json"
+    previous = {v["file"]: v["digest"] for v in (load_manifest(manifest_path) or {}).get("volumes", [])}
+    stats = {"hits": 0, "misses": 0, "evictions": 0}
+    # Opened once for in-process compiles and font subsets; worker processes open their own.
+    cache = SlideCache(cache_dir, cache_max_bytes) if cache_dir and (workers == 1 or font_dir) else None
+
+    keys = [slide_key(shapes, SERIALIZER_VERSION, minimize) for shapes in slides]
+    font_salt = ""
+    if font_dir:
+        # Swapping a font file must rebuild the volumes that embed it.
+        font_salt = ",".join(sorted(
+            font_embed.file_digest(path, os.stat(path).st_mtime, os.stat(path).st_size)
+            for path in font_embed.font_index(os.path.abspath(font_dir)).values()
+        ))
+    compiled = {}
+    if max_bytes:
+        # Sizing needs the compressed parts, so compile everything up front.
+        compiled = compile_parallel(slides, range(len(slides)), cache_dir, cache_max_bytes, minimize, workers, stats, cache)
+        sizes = [len(compiled[i][0].data) + len(compiled[i][1].data) + SLIDE_OVERHEAD for i in range(len(slides))]
+        groups = plan_by_bytes(sizes, max_bytes, max_slides)
+    else:
+        groups = plan_by_count(len(slides), max_slides)
+
+    volumes = []
+    stale = []
+    for number, group in enumerate(groups, 1):
+        filename = f"{stem}.vol{number:03d}.pptx"
+        digest = volume_digest(title, number, (keys[i] for i in group), font_salt)
+        group_turns = [turns[i] for i in group if turns[i] is not None]
+        volumes.append({
+            "volume": number,
+            "file": filename,
+            "first_slide": group[0] + 1,
+            "last_slide": group[-1] + 1,
+            "first_turn": min(group_turns) if group_turns else None,
+            "last_turn": max(group_turns) if group_turns else None,
+            "digest": digest,
+        })
+        if previous.get(filename) != digest or not os.path.exists(os.path.join(out_dir, filename)):
+            stale.append((number, group))
+
+    missing = [i for _, group in stale for i in group if i not in compiled]
+    compiled.update(compile_parallel(slides, missing, cache_dir, cache_max_bytes, minimize, workers, stats, cache))
+
+    volume_fonts = {}
+    if font_dir:
+        # Subset in this process so the one slide cache instance is not shared across threads.
+        for number, group in stale:
+            volume_fonts[number] = font_embed.embed_fonts([slides[i] for i in group], font_dir, cache)[0]
+
+    def write(job):
+        number, group = job
+        path = os.path.join(out_dir, f"{stem}.vol{number:03d}.pptx")
+        write_package(
+            path, len(group), (compiled[i] for i in group), f"{title} · Volume {number}", volume_fonts.get(number, ()),
+        )
+
+    shared_parts()  # deflate the shared parts once, before the threads race for them
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(write, stale))
+
+    for v in volumes:
+        v["bytes"] = os.path.getsize(os.path.join(out_dir, v["file"]))
+    # A deck that shrank leaves trailing volumes from the previous run behind.
+    for filename in set(previous) - {v["file"] for v in volumes}:
+        try:
+            os.remove(os.path.join(out_dir, filename))
+        except FileNotFoundError:
+            pass
+
+    index_file = f"{stem}.index.pptx"
+    write_pptx(index_slides(title, volumes), os.path.join(out_dir, index_file), title=f"{title} · Index")
+
+    turn_map = {}
+    for v, group in zip(volumes, groups):
+        for i in group:
+            if turns[i] is not None:
+                turn_map[str(turns[i])] = v["volume"]
+    manifest = {
+        "title": title,
+        "slides": len(slides),
+        "index": index_file,
+        "volumes": volumes,
+        "turns": turn_map,
+    }
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    stats["written"] = len(stale)
+    return manifest, stats
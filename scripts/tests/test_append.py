@@ -0,0 +1,166 @@
+import zipfile
+
+from slidekit.append import append_slides, compact, deck_slide_count
+from slidekit.pptx import write_pptx
+from slidekit.report import report_slides
+
+
+def game(n_turns):
+    agents = [{"id": "a0", "name": "Agent 0", "type": "Lab", "state": "idle", "actionHistory": []}]
+    turns = [
+        {
+            "turn": t,
+            "headline": f"Headline {t}",
+            "narration": "Things happen & more <x>.",
+            "context": "",
+            "agents": [{"id": "a0", "name": "Agent 0", "type": "Lab", "state": f"state {t}"}],
+            "agentActions": [{"agentId": "a0", "action": f"acts on turn {t}"}],
+        }
+        for t in range(1, n_turns + 1)
+    ]
+    return {"id": "g1", "name": "Test Game", "state": {"agents": agents}, "turns": turns}
+
+
+def check_package(path, slide_count):
+    with zipfile.ZipFile(path) as z:
+        assert z.testzip() is None
+        names = z.namelist()
+        assert len([n for n in names if n.startswith("ppt/slides/slide")]) == slide_count
+        presentation = z.read("ppt/presentation.xml").decode()
+        assert presentation.count("<p:sldId ") == slide_count
+        assert f"<Slides>{slide_count}</Slides>" in z.read("docProps/app.xml").decode()
+        return names
+
+
+def test_append_then_compact(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    write_pptx(report_slides(game(2)), path, title="Test Game")
+    assert deck_slide_count(path) == 3
+
+    record = game(5)
+    assert append_slides(path, report_slides(record, first_turn_index=2)) == 6
+    check_package(path, 6)
+    assert append_slides(path, report_slides(record, first_turn_index=5)) == 6
+
+    compact(path)
+    names = check_package(path, 6)
+    assert names[0] == "[Content_Types].xml"
+    assert len(names) == len(set(names))
+
+
+def test_failed_compile_leaves_deck_intact(tmp_path, monkeypatch):
+    import slidekit.append
+
+    path = str(tmp_path / "deck.pptx")
+    write_pptx(report_slides(game(2)), path, title="Test Game")
+    with open(path, "rb") as f:
+        before = f.read()
+
+    real_compile = slidekit.append.compile_slide
+    calls = []
+
+    def flaky_compile(shapes, cache=None, minimize=False):
+        calls.append(shapes)
+        if len(calls) == 2:
+            raise OSError("cache disk full")
+        return real_compile(shapes, cache, minimize)
+
+    monkeypatch.setattr(slidekit.append, "compile_slide", flaky_compile)
+    try:
+        append_slides(path, report_slides(game(5), first_turn_index=2))
+    except OSError:
+        pass
+    with open(path, "rb") as f:
+        assert f.read() == before
+    check_package(path, 3)
+
+
+def appended_slide_xml(path, n):
+    with zipfile.ZipFile(path) as z:
+        return z.read(f"ppt/slides/slide{n}.xml").decode()
+
+
+def test_minimized_append_only_with_matching_theme(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    write_pptx(report_slides(game(1)), path, title="Test Game", minimize=True)
+    append_slides(path, report_slides(game(2), first_turn_index=1), minimize=True)
+    assert "<p:style>" in appended_slide_xml(path, 3)
+
+    # Same deck, but with a theme from another version: style indexes would point elsewhere.
+    old = str(tmp_path / "old.pptx")
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(old, "w", zipfile.ZIP_DEFLATED) as dst:
+        for name in src.namelist():
+            data = src.read(name)
+            if name == "ppt/theme/theme1.xml":
+                data = data.replace(b'w="25400"', b'w="38100"')
+            dst.writestr(name, data)
+    append_slides(old, report_slides(game(3), first_turn_index=2), minimize=True)
+    check_package(old, 4)
+    assert "<p:style>" not in appended_slide_xml(old, 4)
+
+
+def test_append_refuses_decks_with_embedded_fonts(tmp_path):
+    from slidekit.package import compress_part
+
+    path = str(tmp_path / "deck.pptx")
+    fonts = [("Fraunces", {"regular": compress_part("font.fntdata", b"\x00\x01\x00\x00subset")})]
+    write_pptx(report_slides(game(2)), path, title="Test Game", fonts=fonts)
+    with open(path, "rb") as f:
+        before = f.read()
+    try:
+        append_slides(path, report_slides(game(3), first_turn_index=2))
+    except ValueError as e:
+        assert "font" in str(e)
+    else:
+        raise AssertionError("append to a deck with embedded fonts should fail")
+    with open(path, "rb") as f:
+        assert f.read() == before
+
+
+def assert_append_refused(path, slides):
+    with open(path, "rb") as f:
+        before = f.read()
+    try:
+        append_slides(path, slides)
+    except ValueError as e:
+        assert "after its turns" in str(e)
+    else:
+        raise AssertionError("append to a deck with trailing sections should fail")
+    with open(path, "rb") as f:
+        assert f.read() == before
+
+
+def test_append_refuses_decks_with_table_sections(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    slides = report_slides(game(2), tables=True)
+    write_pptx(slides, path, title="Test Game", trailing=len(slides) - 3)
+    with zipfile.ZipFile(path) as z:
+        assert z.testzip() is None
+        assert "docProps/custom.xml" in z.namelist()
+    assert_append_refused(path, report_slides(game(3), first_turn_index=2))
+    assert_append_refused(path, [])
+
+
+def test_cli_refuses_to_append_to_a_dossier_deck(tmp_path):
+    import json
+    import os
+    import subprocess
+    import sys
+
+    script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "build_slide_kit.py")
+    out = str(tmp_path / "deck.pptx")
+    for n_turns in (3, 6):
+        with open(tmp_path / f"g{n_turns}.json", "w") as f:
+            json.dump(game(n_turns), f)
+
+    subprocess.run([sys.executable, script, "--game", str(tmp_path / "g3.json"), "--dossiers", "--out", out], check=True)
+    with open(out, "rb") as f:
+        before = f.read()
+    result = subprocess.run(
+        [sys.executable, script, "--game", str(tmp_path / "g6.json"), "--append", "--out", out],
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 2
+    assert "1 slides after its turns" in result.stderr
+    with open(out, "rb") as f:
+        assert f.read() == before
@@ -0,0 +1,50 @@
+import os
+
+from slidekit.cache import SlideCache, decode_entry, encode_entry, slide_key
+from slidekit.package import compress_part
+
+
+def parts(n, size=2000):
+    payload = os.urandom(size)  # incompressible, so entry sizes are predictable
+    return [compress_part(f"slide{n}.xml", payload), compress_part(f"slide{n}.xml.rels", "<r/>")]
+
+
+def test_entry_round_trip():
+    original = parts(1)
+    assert decode_entry(encode_entry(original)) == original
+
+
+def test_slide_key_depends_on_shapes_and_salt():
+    shapes = [{"kind": "rect", "id": 2}]
+    assert slide_key(shapes, 1) == slide_key([{"id": 2, "kind": "rect"}], 1)
+    assert slide_key(shapes, 1) != slide_key(shapes, 2)
+
+
+def test_hits_and_misses(tmp_path):
+    cache = SlideCache(str(tmp_path))
+    assert cache.get("a" * 64) is None
+    cache.put("a" * 64, parts(1))
+    assert cache.get("a" * 64) == cache.get("a" * 64)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+
+
+def test_eviction_respects_max_bytes(tmp_path):
+    entry_size = len(encode_entry(parts(0)))
+    cache = SlideCache(str(tmp_path), max_bytes=3 * entry_size)
+    keys = [f"{i:064x}" for i in range(5)]
+    for i, key in enumerate(keys[:3]):
+        cache.put(key, parts(i))
+    cache.get(keys[0])  # now most recently used
+    cache.put(keys[3], parts(3))
+    cache.put(keys[4], parts(4))
+
+    assert cache.stats()["bytes"] <= 3 * entry_size
+    assert cache.stats()["evictions"] == 2
+    assert cache.get(keys[1]) is None and cache.get(keys[2]) is None
+    assert cache.get(keys[0]) is not None
+
+    # A new instance sees the same bounded directory and evicts down to a smaller budget.
+    reopened = SlideCache(str(tmp_path), max_bytes=entry_size)
+    assert reopened.stats()["entries"] == 1
+    assert reopened.stats()["bytes"] <= entry_size
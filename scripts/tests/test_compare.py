@@ -0,0 +1,31 @@
+from slidekit.compare import comparison_plan, shared_prefix
+
+
+def snapshot(turn, headline):
+    return {"turn": turn, "headline": headline, "narration": "", "agents": [], "agentActions": []}
+
+
+def turns(headlines):
+    return [snapshot(i, h) for i, h in enumerate(headlines, 1)]
+
+
+def test_shared_prefix_is_the_leading_equal_run():
+    # A prefix turn repeated after the fork must not shorten the prefix.
+    assert shared_prefix([turns("xyzq"), turns("xywyzq")]) == 2
+    assert shared_prefix([turns("abc"), turns("abc")]) == 3
+    assert shared_prefix([turns("abc"), turns("ab")]) == 2
+    assert shared_prefix([turns("abcd"), turns("abxd"), turns("aycd")]) == 1
+    assert shared_prefix([turns("abc"), turns("xbc")]) == 0
+
+
+def test_comparison_plan_renders_shared_turns_once():
+    records = [
+        {"id": f"g{i}", "name": f"Branch {i}", "state": {"agents": []}, "turns": turns(h)}
+        for i, h in enumerate(["abcd", "abxy"], 1)
+    ]
+    plan = comparison_plan(records)
+    assert plan["prefix"] == 2
+    assert len(plan["shared"]) == 2
+    head, tail = plan["comparison"]
+    assert len(head) == 1 and len(tail) == 2  # turns 3 and 4, two branches per slide
+    assert [len(branch_tail) for _, branch_tail in plan["branches"]] == [2, 2]
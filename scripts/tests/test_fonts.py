@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("fontTools")
+
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+from slidekit.fonts import embed_fonts, font_index
+from slidekit.layout import paragraph, shape_textbox, text_run
+
+
+def make_font(path, family, weight, italic=False):
+    fb = FontBuilder(1000, isTTF=True)
+    fb.setupGlyphOrder([".notdef", "A", "B"])
+    fb.setupCharacterMap({ord("A"): "A", ord("B"): "B"})
+    pen = TTGlyphPen(None)
+    pen.moveTo((0, 0))
+    pen.lineTo((0, 500))
+    pen.lineTo((500, 0))
+    pen.closePath()
+    glyph = pen.glyph()
+    fb.setupGlyf({".notdef": glyph, "A": glyph, "B": glyph})
+    fb.setupHorizontalMetrics({name: (600, 0) for name in (".notdef", "A", "B")})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": family, "styleName": f"W{weight}"})
+    fb.setupOS2(usWeightClass=weight, fsType=0, fsSelection=0x01 if italic else 0x40)
+    fb.setupPost()
+    fb.save(str(path))
+
+
+def test_font_index_matches_faces_by_weight(tmp_path):
+    # Sorted by name, Light would come first and used to win "regular".
+    for name, weight, italic in [
+        ("Fam-Light.ttf", 300, False),
+        ("Fam-Medium.ttf", 500, False),
+        ("Fam-Regular.ttf", 400, False),
+        ("Fam-SemiBold.ttf", 600, False),
+        ("Fam-Bold.ttf", 700, False),
+        ("Fam-Italic.ttf", 400, True),
+    ]:
+        make_font(tmp_path / name, "Fam", weight, italic)
+    index = font_index(str(tmp_path))
+    assert index[("Fam", "regular")].endswith("Fam-Regular.ttf")
+    assert index[("Fam", "bold")].endswith("Fam-Bold.ttf")
+    assert index[("Fam", "italic")].endswith("Fam-Italic.ttf")
+    assert ("Fam", "boldItalic") not in index
+
+
+def test_closest_weight_wins_without_an_exact_face(tmp_path):
+    make_font(tmp_path / "Other-Light.ttf", "Other", 300)
+    make_font(tmp_path / "Other-Medium.ttf", "Other", 500)
+    make_font(tmp_path / "Other-SemiBold.ttf", "Other", 600)
+    index = font_index(str(tmp_path))
+    assert index[("Other", "regular")].endswith("Other-Medium.ttf")
+    assert index[("Other", "bold")].endswith("Other-SemiBold.ttf")
+
+
+def test_embed_fonts_subsets_used_styles(tmp_path):
+    make_font(tmp_path / "Fam-Regular.ttf", "Fam", 400)
+    slides = [[shape_textbox(2, "T", 0, 0, 10, 10, [paragraph([
+        text_run("A", "Fam", 1200, "000000"),
+        text_run("B", "Fam", 1200, "000000", bold=True),
+        text_run("A", "Missing", 1200, "000000"),
+    ])])]]
+    fonts, missing = embed_fonts(slides, str(tmp_path))
+    assert missing == ["Missing"]
+    assert [(typeface, list(parts)) for typeface, parts in fonts] == [("Fam", ["regular"])]
@@ -0,0 +1,81 @@
+from xml.dom import minidom
+
+from slidekit.layout import COLORS, emu, paragraph, shape_rect, shape_textbox, text_run
+from slidekit.pptx import paragraph_xml, shape_props, slide_xml, textbox_xml
+
+NS = (
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
+)
+
+
+def parse(fragment):
+    return minidom.parseString(f"<root {NS}>{fragment}</root>")
+
+
+def card(line=(COLORS["ink"], 12700, 0.10), fill=(COLORS["surface2"], 1.0)):
+    return shape_textbox(
+        2, "Card", 0, 0, emu(2), emu(1),
+        [paragraph([text_run("Hi", "Space Grotesk", 1100, COLORS["ink"])])],
+        fill=fill, line=line, round_rect=True,
+    )
+
+
+def test_adjacent_runs_with_equal_properties_are_merged():
+    para = paragraph([
+        text_run("Agent ", "Space Grotesk", 1100, COLORS["ink"], bold=True),
+        text_run("7: ", "Space Grotesk", 1100, COLORS["ink"], bold=True),
+        text_run("acts", "Space Grotesk", 1100, COLORS["muted"]),
+        text_run(" now", "Space Grotesk", 1100, COLORS["muted"]),
+    ])
+    runs = parse(paragraph_xml(para, minimize=True)).getElementsByTagName("a:r")
+    assert [r.getElementsByTagName("a:t")[0].firstChild.data for r in runs] == ["Agent 7: ", "acts now"]
+    assert len(parse(paragraph_xml(para)).getElementsByTagName("a:r")) == 4
+
+
+def test_defaults_are_dropped():
+    para = paragraph([text_run("Hi", "Space Grotesk", 1100, COLORS["ink"])], align="l")
+    full = paragraph_xml(para)
+    small = paragraph_xml(para, minimize=True)
+    assert "<a:endParaRPr" in full and "<a:pPr" in full
+    assert "<a:endParaRPr" not in small and "<a:pPr" not in small
+    # Non-default alignment is kept.
+    assert "algn=\"ctr\"" in paragraph_xml(paragraph(para["runs"], align="ctr"), minimize=True)
+
+    shape = card()
+    assert "<a:avLst/>" in textbox_xml(shape)
+    assert "<a:avLst/>" not in textbox_xml(shape, minimize=True)
+    assert "<a:lstStyle/>" not in textbox_xml(shape, minimize=True)
+
+
+def test_bordered_card_uses_theme_style_refs():
+    doc = parse(shape_props(card(), minimize=True))
+    sp_pr = doc.getElementsByTagName("p:spPr")[0]
+    assert not sp_pr.getElementsByTagName("a:ln")
+    assert not sp_pr.getElementsByTagName("a:solidFill")
+    style = doc.getElementsByTagName("p:style")[0]
+    # THEME_LINE_STYLES[1] is the 12700 EMU ink line at 10%; THEME_FILL_STYLES[1] is surface2.
+    assert style.getElementsByTagName("a:lnRef")[0].getAttribute("idx") == "2"
+    assert style.getElementsByTagName("a:fillRef")[0].getAttribute("idx") == "2"
+
+
+def test_unmatched_fill_stays_inline_with_line_ref():
+    doc = parse(shape_props(card(fill=(COLORS["accent"], 1.0)), minimize=True))
+    assert doc.getElementsByTagName("p:spPr")[0].getElementsByTagName("a:solidFill")
+    assert doc.getElementsByTagName("a:fillRef")[0].getAttribute("idx") == "0"
+
+
+def test_shape_without_line_gets_no_style():
+    shape = shape_rect(2, "Background", 0, 0, emu(13), emu(7), fill=(COLORS["surface"], 1.0))
+    xml = shape_props(shape, minimize=True)
+    assert "<p:style>" not in xml
+    assert "<a:solidFill>" in xml
+    assert "<a:ln" not in xml and "<a:noFill/>" not in xml
+
+
+def test_minimized_slide_parses_and_is_smaller():
+    shapes = [shape_rect(2, "Background", 0, 0, emu(13), emu(7), fill=(COLORS["bg"], 1.0)), card()]
+    full, small = slide_xml(shapes), slide_xml(shapes, minimize=True)
+    minidom.parseString(full)
+    minidom.parseString(small)
+    assert len(small) < len(full)
@@ -0,0 +1,44 @@
+import io
+import zipfile
+
+from slidekit.package import PackageWriter, compress_part, inflate, read_entries, read_part
+
+
+def build(members):
+    buf = io.BytesIO()
+    with PackageWriter(buf) as z:
+        for name, data in members:
+            z.add(name, data)
+    return buf
+
+
+def test_writer_output_reads_with_zipfile():
+    members = [("a.xml", "<a/>"), ("dir/b.bin", b"\x00\x01" * 5000), ("empty.txt", "")]
+    buf = build(members)
+    with zipfile.ZipFile(buf) as z:
+        assert z.testzip() is None
+        assert z.namelist() == [name for name, _ in members]
+        assert z.read("a.xml") == b"<a/>"
+        assert z.read("dir/b.bin") == b"\x00\x01" * 5000
+
+
+def test_read_entries_and_parts_round_trip():
+    buf = build([("a.xml", "<a/>"), ("b.xml", "<b>" + "x" * 1000 + "</b>")])
+    entries, cd_offset = read_entries(buf)
+    assert [e.name for e in entries] == [b"a.xml", b"b.xml"]
+    assert cd_offset < len(buf.getvalue())
+    part = read_part(buf, entries[1])
+    assert part == compress_part("b.xml", "<b>" + "x" * 1000 + "</b>")
+    assert inflate(part) == ("<b>" + "x" * 1000 + "</b>").encode()
+
+
+def test_writer_continues_an_existing_archive():
+    buf = build([("a.xml", "<a/>")])
+    entries, cd_offset = read_entries(buf)
+    buf.seek(cd_offset)
+    with PackageWriter(buf, offset=cd_offset, entries=entries) as z:
+        z.add("b.xml", "<b/>")
+    buf.truncate()
+    with zipfile.ZipFile(buf) as z:
+        assert z.testzip() is None
+        assert z.namelist() == ["a.xml", "b.xml"]
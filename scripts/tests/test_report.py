@@ -0,0 +1,41 @@
+from slidekit.report import agent_index, dossier_slides
+
+
+def record(n_turns, snapshots=True):
+    history = [{"turn": t, "action": f"acts on turn {t}"} for t in range(1, n_turns + 1)]
+    agents = [{"id": "a0", "name": "Agent 0", "type": "Lab", "state": "latest", "actionHistory": history}]
+    rec = {"id": "g1", "state": {"agents": agents, "history": [
+        {"turn": t, "headline": f"Headline {t}", "narration": ""} for t in range(1, n_turns + 1)
+    ]}}
+    if snapshots:
+        rec["turns"] = [
+            {
+                "turn": t,
+                "headline": f"Headline {t}",
+                "narration": "",
+                "context": "",
+                "agents": [{"id": "a0", "name": "Agent 0", "type": "Lab", "state": f"state {t}"}],
+                "agentActions": [{"agentId": "a0", "action": f"acts on turn {t}"}],
+            }
+            for t in range(1, n_turns + 1)
+        ]
+    return rec
+
+
+def actions(index):
+    return [a for t in sorted(index["a0"]["turns"]) for a in index["a0"]["turns"][t]["actions"]]
+
+
+def test_snapshot_actions_are_not_duplicated_by_history():
+    index = agent_index(record(8))
+    assert actions(index) == [f"acts on turn {t}" for t in range(1, 9)]
+    assert index["a0"]["turns"][8]["state"] == "state 8"
+
+
+def test_history_only_record_uses_action_history():
+    index = agent_index(record(8, snapshots=False))
+    assert actions(index) == [f"acts on turn {t}" for t in range(1, 9)]
+    assert index["a0"]["state"] == "latest"
+
+    meta = dossier_slides(record(8, snapshots=False))[0][3]
+    assert "8 actions" in meta["paragraphs"][0]["runs"][0]["text"]
@@ -0,0 +1,65 @@
+from xml.dom import minidom
+
+from slidekit.layout import emu, line_count, row_height
+from slidekit.pptx import slide_xml
+from slidekit.report import TABLE_BODY, TABLE_MAX_H, action_log_slides
+
+
+def record(n_turns, n_agents):
+    agents = [{"id": f"a{i}", "name": f"Agent {i}", "type": "Lab", "state": ""} for i in range(n_agents)]
+    turns = [
+        {
+            "turn": t,
+            "headline": f"Headline {t}",
+            "narration": "",
+            "agents": agents,
+            # Varying lengths so rows wrap to different heights.
+            "agentActions": [{"agentId": a["id"], "action": "moves " * (1 + (t * 7 + i) % 30)} for i, a in enumerate(agents)],
+        }
+        for t in range(1, n_turns + 1)
+    ]
+    return {"id": "g1", "state": {"agents": agents}, "turns": turns}
+
+
+def tables(slides):
+    return [next(s for s in shapes if s["kind"] == "table") for shapes in slides]
+
+
+def test_row_height_grows_with_wrapped_text():
+    width = emu(2.0)
+    assert line_count("short", width, TABLE_BODY) == 1
+    assert line_count("word " * 60, width, TABLE_BODY) > 3
+    min_h = emu(0.36)
+    assert row_height(["short"], [width], TABLE_BODY, min_h) == min_h
+    assert row_height(["word " * 60], [width], TABLE_BODY, min_h) > min_h
+
+
+def test_long_action_log_pages_fit_the_slide():
+    slides = action_log_slides(record(12, 6))
+    pages = tables(slides)
+    assert len(pages) > 1
+    assert sum(len(t["rows"]) for t in pages) == 12 * 6
+    for n, (shapes, table) in enumerate(zip(slides, pages), 1):
+        assert table["h"] <= TABLE_MAX_H
+        assert table["h"] == table["header_h"] + sum(table["row_heights"])
+        assert table["header"] == ["TURN", "HEADLINE", "AGENT", "ACTION"]
+        title = next(s for s in shapes if s["name"] == "Table Title")
+        assert title["paragraphs"][0]["runs"][0]["text"] == f"Action Log ({n}/{len(pages)})"
+    # Turn labels only head the first row of each turn, across page breaks too.
+    turn_col = [row[0] for t in pages for row in t["rows"]]
+    assert [c for c in turn_col if c] == [f"T{t:02d}" for t in range(1, 13)]
+
+
+def test_table_xml_is_well_formed():
+    for minimize in (False, True):
+        shapes = action_log_slides(record(2, 3))[0]
+        doc = minidom.parseString(slide_xml(shapes, minimize))
+        tbl = doc.getElementsByTagName("a:tbl")[0]
+        rows = tbl.getElementsByTagName("a:tr")
+        assert len(rows) == 1 + 2 * 3
+        assert len(tbl.getElementsByTagName("a:gridCol")) == 4
+        for tc_pr in tbl.getElementsByTagName("a:tcPr"):
+            children = [c.tagName for c in tc_pr.childNodes]
+            # CT_TableCellProperties: borders come before the cell fill.
+            assert children[0] == "a:lnB"
+            assert children[1] in ("a:solidFill", "a:noFill")
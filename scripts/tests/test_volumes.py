@@ -0,0 +1,54 @@
+import json
+import zipfile
+
+from slidekit.report import report_slides
+from slidekit.volumes import write_volumes
+
+
+def game(n_turns):
+    turns = [
+        {"turn": t, "headline": f"Headline {t}", "narration": "Narration.", "context": "", "agents": [], "agentActions": []}
+        for t in range(1, n_turns + 1)
+    ]
+    return {"id": "g1", "name": "Test Game", "state": {"agents": []}, "turns": turns}
+
+
+def test_volumes_rebuild_only_changed_volumes(tmp_path):
+    base = str(tmp_path / "deck")
+    cache_dir = str(tmp_path / "cache")
+    turns = [None] + list(range(1, 13))
+    manifest, stats = write_volumes(report_slides(game(12)), base, "Test Game", turns=turns, max_slides=5,
+                                    cache_dir=cache_dir, workers=2)
+    assert [v["last_slide"] for v in manifest["volumes"]] == [5, 10, 13]
+    assert (stats["written"], stats["misses"], stats["hits"]) == (3, 13, 0)
+    for v in manifest["volumes"]:
+        with zipfile.ZipFile(tmp_path / v["file"]) as z:
+            assert z.testzip() is None
+    assert manifest["turns"]["12"] == 3
+
+    turns.append(13)
+    manifest, stats = write_volumes(report_slides(game(13)), base, "Test Game", turns=turns, max_slides=5,
+                                    cache_dir=cache_dir, workers=1)
+    assert stats["written"] == 1
+    assert (stats["misses"], stats["hits"]) == (1, 3)
+    with open(f"{base}.manifest.json") as f:
+        assert json.load(f)["slides"] == 14
+
+
+def test_single_worker_opens_the_cache_once(tmp_path, monkeypatch):
+    import slidekit.volumes
+
+    opened = []
+    real_cache = slidekit.volumes.SlideCache
+
+    def counting_cache(*args, **kwargs):
+        opened.append(args)
+        return real_cache(*args, **kwargs)
+
+    monkeypatch.setattr(slidekit.volumes, "SlideCache", counting_cache)
+    # --volume-mb compiles in two passes: everything for sizing, then nothing left to compile.
+    manifest, stats = write_volumes(report_slides(game(6)), str(tmp_path / "deck"), "Test Game", max_bytes=40_000,
+                                    cache_dir=str(tmp_path / "cache"), workers=1)
+    assert len(opened) == 1
+    assert stats["misses"] == 7
+    assert slidekit.volumes.worker_cache is None